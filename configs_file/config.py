@@ -1,10 +1,16 @@
+from bisect import bisect_left
+from typing import Optional
 
 
 class Config:
     """Configuration class for storing ignore lists and settings."""
-    
+
+    # Frozensets replaced (never mutated) by the methods below, so the
+    # properties hand them out without copying and the sorted tuples stay in step
+    __slots__ = ("_dirs", "_files", "_sorted_dirs", "_sorted_files")
+
     # Default ignore directories
-    DEFAULT_IGNORE_DIRS = {
+    DEFAULT_IGNORE_DIRS = frozenset({
         ".git",
         ".venv",
         "venv",
@@ -17,57 +23,115 @@ class Config:
         "build",
         ".antigravityignore",
         "migrations",
-    }
+    })
 
     # Default ignore files
-    DEFAULT_IGNORE_FILES = {
+    DEFAULT_IGNORE_FILES = frozenset({
         ".DS_Store",
         ".antigravityignore",
         ".gitignore",
         "Thumbs.db",
         "project_structure.txt",
         "generate_structure.py",
-    }
+    })
+
+    # Defaults pre-sorted once, seeding the sorted caches on init and reset
+    _DEFAULT_SORTED_DIRS = tuple(sorted(DEFAULT_IGNORE_DIRS))
+    _DEFAULT_SORTED_FILES = tuple(sorted(DEFAULT_IGNORE_FILES))
 
     def __init__(self):
         """Initialize Config with default ignore lists."""
-        self.ignore_dirs = set(self.DEFAULT_IGNORE_DIRS)
-        self.ignore_files = set(self.DEFAULT_IGNORE_FILES)
+        self.reset_to_defaults()
+
+    @property
+    def ignore_dirs(self) -> frozenset[str]:
+        """Ignored directory names; assign a new collection to replace them."""
+        return self._dirs
+
+    @ignore_dirs.setter
+    def ignore_dirs(self, dir_names) -> None:
+        self._dirs = frozenset(dir_names)
+        self._sorted_dirs = None
+
+    @property
+    def ignore_files(self) -> frozenset[str]:
+        """Ignored file names; assign a new collection to replace them."""
+        return self._files
+
+    @ignore_files.setter
+    def ignore_files(self, file_names) -> None:
+        self._files = frozenset(file_names)
+        self._sorted_files = None
 
     def add_ignore_dir(self, dir_name: str) -> None:
         """Add a directory to ignore list."""
-        self.ignore_dirs.add(dir_name)
+        if dir_name not in self._dirs:
+            self._dirs = self._dirs | {dir_name}
+            self._sorted_dirs = _sorted_insert(self._sorted_dirs, dir_name)
 
     def add_ignore_dirs(self, dir_list: list[str]) -> None:
         """Add multiple directories to ignore list."""
-        self.ignore_dirs.update(dir_list)
+        self.ignore_dirs = self._dirs.union(dir_list)
 
     def add_ignore_file(self, file_name: str) -> None:
         """Add a file to ignore list."""
-        self.ignore_files.add(file_name)
+        if file_name not in self._files:
+            self._files = self._files | {file_name}
+            self._sorted_files = _sorted_insert(self._sorted_files, file_name)
 
     def add_ignore_files(self, file_list: list[str]) -> None:
         """Add multiple files to ignore list."""
-        self.ignore_files.update(file_list)
+        self.ignore_files = self._files.union(file_list)
 
     def remove_ignore_dir(self, dir_name: str) -> None:
         """Remove a directory from ignore list."""
-        self.ignore_dirs.discard(dir_name)
+        if dir_name in self._dirs:
+            self._dirs = self._dirs - {dir_name}
+            self._sorted_dirs = _sorted_remove(self._sorted_dirs, dir_name)
 
     def remove_ignore_file(self, file_name: str) -> None:
         """Remove a file from ignore list."""
-        self.ignore_files.discard(file_name)
+        if file_name in self._files:
+            self._files = self._files - {file_name}
+            self._sorted_files = _sorted_remove(self._sorted_files, file_name)
+
+    def matches_ignored(self, name: str) -> bool:
+        """Check whether a directory name is in the ignore list."""
+        return name in self._dirs
 
-    def get_ignore_dirs(self) -> list[str]:
-        """Get current ignore directories sorted."""
-        return sorted(self.ignore_dirs)
+    def get_ignore_dirs(self) -> tuple[str, ...]:
+        """Get current ignore directories sorted (cached until modified)."""
+        if self._sorted_dirs is None:
+            self._sorted_dirs = tuple(sorted(self._dirs))
+        return self._sorted_dirs
 
-    def get_ignore_files(self) -> list[str]:
-        """Get current ignore files sorted."""
-        return sorted(self.ignore_files)
+    def get_ignore_files(self) -> tuple[str, ...]:
+        """Get current ignore files sorted (cached until modified)."""
+        if self._sorted_files is None:
+            self._sorted_files = tuple(sorted(self._files))
+        return self._sorted_files
 
     def reset_to_defaults(self) -> None:
         """Reset to default ignore lists."""
-        self.ignore_dirs = set(self.DEFAULT_IGNORE_DIRS)
-        self.ignore_files = set(self.DEFAULT_IGNORE_FILES)
+        self._dirs = self.DEFAULT_IGNORE_DIRS
+        self._files = self.DEFAULT_IGNORE_FILES
+        self._sorted_dirs = self._DEFAULT_SORTED_DIRS
+        self._sorted_files = self._DEFAULT_SORTED_FILES
+
+def _sorted_insert(items: Optional[tuple[str, ...]], name: str) -> Optional[tuple[str, ...]]:
+    """Insert a new name into a sorted tuple, keeping it sorted.
+
+    A None cache stays None and is sorted in full on the next read.
+    """
+    if items is None:
+        return None
+    idx = bisect_left(items, name)
+    return items[:idx] + (name,) + items[idx:]
+
 
+def _sorted_remove(items: Optional[tuple[str, ...]], name: str) -> Optional[tuple[str, ...]]:
+    """Remove a present name from a sorted tuple."""
+    if items is None:
+        return None
+    idx = bisect_left(items, name)
+    return items[:idx] + items[idx + 1:]
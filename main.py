@@ -1,6 +1,8 @@
 # main.py
 """Main entry point for Scripts_module."""
 
+import os
+import sys
 from tools.loader import load_tools
 from util.utils import Utils
 
@@ -10,6 +12,14 @@ class ProjectStructureApp:
     def __init__(self):
         """Initialize application."""
         self.tools = load_tools()
+        # Menu uses metadata only; a tool's module is imported when it's picked
+        tool_names = self.tools.names()
+        self._actions = {str(idx): name for idx, (name, _) in enumerate(tool_names, start=1)}
+        # Tool list is fixed after loading, so the menu body is rendered once
+        self._menu_body = "\n".join(
+            f"{idx}. {name} — {description}"
+            for idx, (name, description) in enumerate(tool_names, start=1)
+        ) + "\n0. Exit\n" + "-" * 40
         self.running = True
 
     def display_menu(self) -> None:
@@ -17,10 +27,7 @@ class ProjectStructureApp:
         Utils.clear_screen()
         Utils.print_header("🛠 TOOL EXECUTOR")
 
-        for idx, tool in enumerate(self.tools, start=1):
-            print(f"{idx}. {tool.name} — {tool.description}")
-        print("0. Exit")
-        print("-" * 40)
+        print(self._menu_body)
 
     def run(self) -> None:
         """Run the main application loop."""
@@ -31,12 +38,11 @@ class ProjectStructureApp:
             if choice == "0":
                 break
 
-            if choice.isdigit():
-                index = int(choice) - 1
-                if 0 <= index < len(self.tools):
-                    self.tools[index].run()
-                else:
-                    print("❌ Invalid option")
+            name = self._actions.get(choice)
+            if name:
+                self.tools[name].run()
+            elif choice.isdigit():
+                print("❌ Invalid option")
             else:
                 print("❌ Invalid input")
 
@@ -44,6 +50,9 @@ class ProjectStructureApp:
 
 def main():
     """Main entry point"""
+    # `main.py <project path>` answers every tool's project path prompt up front
+    if len(sys.argv) > 1:
+        os.environ["DPM_PROJECT_PATH"] = os.path.abspath(sys.argv[1])
     app = ProjectStructureApp()
     app.run()
 
@@ -0,0 +1,23 @@
+# tools/_registry.py
+
+from typing import Dict, Type
+from tools.base_tool import BaseTool
+
+# Tool classes registered on import, keyed by tool name
+REGISTRY: Dict[str, Type[BaseTool]] = {}
+
+
+def register_tool(cls: Type[BaseTool]) -> Type[BaseTool]:
+    """Class decorator that marks a BaseTool subclass as a menu tool.
+
+    Only decorated classes are tools, so helper subclasses of BaseTool are
+    never picked up by the loader.
+
+    Args:
+        cls (Type[BaseTool]): Tool class.
+
+    Returns:
+        Type[BaseTool]: The class, unchanged.
+    """
+    REGISTRY[cls.name] = cls
+    return cls
@@ -1,10 +1,24 @@
 """Tool to clean pycache directories."""
 
 import os
-import shutil
+import stat
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from tools._registry import register_tool
 from tools.base_tool import BaseTool
 from util.utils import Utils
 
+# os.fwalk and dir_fd-relative unlink/stat are POSIX-only
+_HAS_FWALK = (
+    hasattr(os, "fwalk")
+    and os.unlink in os.supports_dir_fd
+    and os.stat in os.supports_dir_fd
+)
+
+# Number of buffered progress lines written per stdout call
+_PROGRESS_BATCH = 64
+
+@register_tool
 class CleanPycacheTool(BaseTool):
     """Remove all pycache folders recursively."""
 
@@ -24,62 +38,121 @@ class CleanPycacheTool(BaseTool):
             print("❌ Operation cancelled.")
             return
 
+        pycache_dirs = []
+        for root, dirs, files in os.walk(start_path, topdown=True):
+            # Only VCS folders and virtualenvs are skipped; the generic listing
+            # ignores (migrations, build, ...) still hold bytecode to clean
+            Utils.prune_walk_dirs(dirs, files)
+            if "__pycache__" in dirs:
+                pycache_dirs.append(os.path.join(root, "__pycache__"))
+                dirs.remove("__pycache__")  # Prevent further walking
+
         deleted = 0
         total_size = 0
-
-        for root, dirs, _ in os.walk(start_path, topdown=True):
-            if "__pycache__" in dirs:
-                path = os.path.join(root, "__pycache__")
+        progress = []
+
+        # Deletion is syscall-bound, so threads overlap the unlink/rmdir latency
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._purge_pycache, path): path
+                for path in pycache_dirs
+            }
+            for future in as_completed(futures):
+                path = futures[future]
                 try:
-                    folder_size = self._calculate_folder_size(path)
-                    shutil.rmtree(path, ignore_errors=True)
-                    dirs.remove("__pycache__")  # Prevent further walking
-                    deleted += 1
-                    total_size += folder_size
-
-                    print(f"✅ Deleted: {os.path.relpath(path, start_path)}")
-                    if folder_size > 0:
-                        print(f"   Size: {self._format_size(folder_size)}")
+                    folder_size = future.result()
                 except Exception as e:
+                    self._flush_progress(progress)
                     print(f"❌ Failed to delete {path}: {e}")
+                    continue
+
+                deleted += 1
+                total_size += folder_size
+
+                progress.append(f"✅ Deleted: {os.path.relpath(path, start_path)}")
+                if folder_size > 0:
+                    progress.append(f"   Size: {Utils.format_size(folder_size)}")
+                if len(progress) >= _PROGRESS_BATCH:
+                    self._flush_progress(progress)
+
+        self._flush_progress(progress)
 
         if deleted > 0:
             print(f"\n🎯 Summary:")
             print(f"   • Folders deleted: {deleted}")
-            print(f"   • Space freed: {self._format_size(total_size)}")
+            print(f"   • Space freed: {Utils.format_size(total_size)}")
         else:
             print("\nℹ️  No __pycache__ folders found.")
         input("\nPress Enter to continue...")
 
     @staticmethod
-    def _calculate_folder_size(folder_path: str) -> int:
-        """Calculate total size of a folder in bytes.
+    def _flush_progress(lines: list) -> None:
+        """Write buffered progress lines in a single call and clear the buffer.
+
+        Args:
+            lines (list): Pending output lines.
+        """
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+            lines.clear()
+
+    @classmethod
+    def _purge_pycache(cls, folder_path: str) -> int:
+        """Delete a folder recursively, tallying file sizes in the same pass.
 
         Args:
             folder_path (str): Path to folder.
 
         Returns:
-            int: Total size in bytes.
+            int: Total size of successfully deleted files in bytes.
         """
+        if _HAS_FWALK:
+            return cls._purge_with_fwalk(folder_path)
+
+        # Entries that can't be removed are skipped; the final rmdir reports failure
         total_size = 0
-        for dirpath, _, filenames in os.walk(folder_path):
-            for filename in filenames:
-                filepath = os.path.join(dirpath, filename)
-                total_size += os.path.getsize(filepath)
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        total_size += cls._purge_pycache(entry.path)
+                    else:
+                        file_size = entry.stat(follow_symlinks=False).st_size
+                        os.unlink(entry.path)
+                        total_size += file_size
+                except OSError:
+                    continue
+        os.rmdir(folder_path)
         return total_size
 
     @staticmethod
-    def _format_size(size_bytes: int) -> str:
-        """Format file size in human readable format.
+    def _purge_with_fwalk(folder_path: str) -> int:
+        """Delete a folder using stat/unlink relative to open directory fds.
 
         Args:
-            size_bytes (int): Size in bytes.
+            folder_path (str): Path to folder.
 
         Returns:
-            str: Formatted size string.
+            int: Total size of deleted files in bytes.
         """
-        for unit in ["B", "KB", "MB", "GB"]:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.2f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.2f} TB"
\ No newline at end of file
+        total_size = 0
+        for _, dirs, files, dir_fd in os.fwalk(folder_path, topdown=False, follow_symlinks=False):
+            for name in files:
+                try:
+                    file_size = os.stat(name, dir_fd=dir_fd, follow_symlinks=False).st_size
+                    os.unlink(name, dir_fd=dir_fd)
+                    total_size += file_size
+                except OSError:
+                    continue
+            for name in dirs:
+                try:
+                    # fwalk lists symlinks to directories here but never descends into them
+                    if stat.S_ISLNK(os.stat(name, dir_fd=dir_fd, follow_symlinks=False).st_mode):
+                        os.unlink(name, dir_fd=dir_fd)
+                    else:
+                        os.rmdir(name, dir_fd=dir_fd)
+                except OSError:
+                    continue
+        os.rmdir(folder_path)
+        return total_size
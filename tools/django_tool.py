@@ -3,51 +3,64 @@
 import os
 import subprocess
 import sys
+from pathlib import Path
 from typing import Tuple, Optional
+from tools._registry import register_tool
 from tools.base_tool import BaseTool
 from util.utils import Utils
 
+@register_tool
 class DjangoTool(BaseTool):
     """Manage Django projects and apps."""
 
     name = "🚀 Django Manager"
     description = "Create Django project, check, create app, migrate, runserver"
 
+    _MENU = (
+        "\n1. Create Django Project"
+        "\n2. Check Django Installation"
+        "\n3. Create Django App"
+        "\n4. Make Migrations"
+        "\n5. Apply Migrations"
+        "\n6. Run Development Server"
+        "\n7. Back to Main Menu"
+    )
+
+    _PY = sys.executable
+
+    def __init__(self):
+        """Initialize tool state."""
+        self._proj_cache: dict[str, str] = {}
+        self._actions = {
+            "1": self._create_project,
+            "2": self._check_django,
+            "3": self._create_app,
+            "4": self._make_migrations,
+            "5": self._migrate,
+            "6": self._run_server,
+        }
+
     def run(self) -> None:
         """Display Django management menu."""
         while True:
             Utils.clear_screen()
             Utils.print_header("DJANGO PROJECT MANAGER")
 
-            print("\n1. Create Django Project")
-            print("2. Check Django Installation")
-            print("3. Create Django App")
-            print("4. Make Migrations")
-            print("5. Apply Migrations")
-            print("6. Run Development Server")
-            print("7. Back to Main Menu")
+            print(self._MENU)
 
             choice = input("\nSelect option (1-7): ").strip()
 
-            if choice == "1":
-                self._create_project()
-            elif choice == "2":
-                self._check_django()
-            elif choice == "3":
-                self._create_app()
-            elif choice == "4":
-                self._make_migrations()
-            elif choice == "5":
-                self._migrate()
-            elif choice == "6":
-                self._run_server()
-            elif choice == "7":
+            if choice == "7":
                 break
+
+            # One dict lookup both validates and dispatches the choice
+            action = self._actions.get(choice)
+            if action:
+                action()
             else:
                 print("❌ Invalid option")
 
-            if choice != "7":
-                input("\nPress Enter to continue...")
+            input("\nPress Enter to continue...")
 
     def _create_project(self) -> None:
         """Create a new Django project."""
@@ -91,7 +104,7 @@ class DjangoTool(BaseTool):
         print("🔍 Checking Django installation...")
 
         # Try python -m django --version
-        success, output = self._run_command([sys.executable, "-m", "django", "--version"])
+        success, output = self._run_command([self._PY, "-m", "django", "--version"])
         
         if success:
             version = output.strip()
@@ -112,7 +125,17 @@ class DjangoTool(BaseTool):
 
         # Check for pip packages
         print("\n🔍 Checking related packages...")
-        self._run_command([sys.executable, "-m", "pip", "list", "|", "findstr", "Django"], shell=True)
+        success, output = self._run_command(
+            [self._PY, "-m", "pip", "list", "--format=freeze", "--disable-pip-version-check"]
+        )
+        if success:
+            matches = [line for line in output.splitlines() if "django" in line.lower()]
+            for line in matches:
+                print(f"   • {line}")
+            if not matches:
+                print("   ℹ️  No Django-related packages found.")
+        else:
+            print(f"   ⚠️  Could not list packages: {output}")
 
     def _create_app(self) -> None:
         """Create a new Django app within a project."""
@@ -134,14 +157,7 @@ class DjangoTool(BaseTool):
 
         print(f"\n🚀 Creating app '{app_name}'...")
         
-        # Change to project directory
-        original_dir = os.getcwd()
-        os.chdir(project_dir)
-        
-        success, output = self._run_command(["python", "manage.py", "startapp", app_name])
-        
-        # Change back
-        os.chdir(original_dir)
+        success, output = self._run_command(self._manage("startapp", app_name), cwd=project_dir)
 
         if success:
             print(f"✅ Django app '{app_name}' created successfully!")
@@ -171,19 +187,12 @@ class DjangoTool(BaseTool):
         
         app_name = input("\nEnter app name (leave empty for all apps): ").strip()
         
-        # Change to project directory
-        original_dir = os.getcwd()
-        os.chdir(project_dir)
-        
         if app_name:
             print(f"\n🔨 Making migrations for '{app_name}'...")
-            success, output = self._run_command(["python", "manage.py", "makemigrations", app_name])
+            success, output = self._run_command(self._manage("makemigrations", app_name), cwd=project_dir)
         else:
             print("\n🔨 Making migrations for all apps...")
-            success, output = self._run_command(["python", "manage.py", "makemigrations"])
-        
-        # Change back
-        os.chdir(original_dir)
+            success, output = self._run_command(self._manage("makemigrations"), cwd=project_dir)
 
         if success:
             print("✅ Migrations created successfully!")
@@ -209,15 +218,8 @@ class DjangoTool(BaseTool):
             print("❌ Operation cancelled.")
             return
 
-        # Change to project directory
-        original_dir = os.getcwd()
-        os.chdir(project_dir)
-        
         print("\n🔄 Applying migrations...")
-        success, output = self._run_command(["python", "manage.py", "migrate"])
-        
-        # Change back
-        os.chdir(original_dir)
+        success, output = self._run_command(self._manage("migrate"), cwd=project_dir)
 
         if success:
             print("✅ Migrations applied successfully!")
@@ -255,20 +257,13 @@ class DjangoTool(BaseTool):
         print("   Press Ctrl+C to stop the server")
         print("-" * 50)
 
-        # Change to project directory
-        original_dir = os.getcwd()
-        os.chdir(project_dir)
-        
         try:
             # Run server in foreground
-            subprocess.run([sys.executable, "manage.py", "runserver", f"127.0.0.1:{port}"])
+            subprocess.run(self._manage("runserver", f"127.0.0.1:{port}"), cwd=project_dir)
         except KeyboardInterrupt:
             print("\n\n🛑 Server stopped by user.")
         except Exception as e:
             print(f"❌ Error running server: {e}")
-        finally:
-            # Change back
-            os.chdir(original_dir)
 
     def _find_django_project(self) -> Optional[str]:
         """Find Django project directory by looking for manage.py.
@@ -277,28 +272,42 @@ class DjangoTool(BaseTool):
             Optional[str]: Path to Django project directory or None.
         """
         current_dir = os.getcwd()
-        
-        # Check current directory and parent directories
-        check_dir = current_dir
-        for _ in range(5):  # Check up to 5 levels up
-            manage_py = os.path.join(check_dir, "manage.py")
-            if os.path.exists(manage_py):
-                return check_dir
-            
-            # Move up one directory
-            parent = os.path.dirname(check_dir)
-            if parent == check_dir:  # Reached root
-                break
-            check_dir = parent
-        
+        hit = self._proj_cache.get(current_dir)
+        if hit is not None:
+            return hit
+
+        # Check current directory and up to 4 parent directories
+        cwd_path = Path(current_dir)
+        for candidate in (cwd_path, *list(cwd_path.parents)[:4]):
+            try:
+                os.stat(candidate / "manage.py")
+            except OSError:
+                continue
+            self._proj_cache[current_dir] = str(candidate)
+            return str(candidate)
+
         return None
 
-    def _run_command(self, cmd: list, shell: bool = False) -> Tuple[bool, str]:
+    def _manage(self, *args: str) -> list:
+        """Build a manage.py command using the current Python interpreter.
+
+        Args:
+            *args (str): manage.py subcommand and its arguments.
+
+        Returns:
+            list: Command list.
+        """
+        return [self._PY, "manage.py", *args]
+
+    def _run_command(
+        self, cmd: list, shell: bool = False, cwd: Optional[str] = None
+    ) -> Tuple[bool, str]:
         """Run a shell command and return success status and output.
 
         Args:
             cmd (list): Command list.
             shell (bool): Whether to use shell.
+            cwd (Optional[str]): Working directory for the command.
 
         Returns:
             Tuple[bool, str]: (success, output)
@@ -307,21 +316,30 @@ class DjangoTool(BaseTool):
             result = subprocess.run(
                 cmd,
                 shell=shell,
+                cwd=cwd,
                 capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='ignore'
             )
             
+            # Decode lazily so only the stream that is actually returned pays for it
             if result.returncode == 0:
-                return True, result.stdout.strip()
+                return True, self._decode(result.stdout)
             else:
-                error_msg = result.stderr.strip() or result.stdout.strip() or "Unknown error"
+                error_msg = self._decode(result.stderr) or self._decode(result.stdout) or "Unknown error"
                 return False, error_msg
                 
         except FileNotFoundError:
-            return False, f"Command not found: {' '.join(cmd)}"
-        except Exception as e:
+            return False, f"Command not found: {cmd[0]}"
+        except OSError as e:
             return False, str(e)
-        
-        
\ No newline at end of file
+
+    @staticmethod
+    def _decode(data: bytes) -> str:
+        """Decode captured process output.
+
+        Args:
+            data (bytes): Raw output bytes.
+
+        Returns:
+            str: Stripped text with normalized newlines.
+        """
+        return data.decode("utf-8", "ignore").replace("\r\n", "\n").strip()
@@ -2,42 +2,96 @@
 
 import os
 import shutil
+import stat
 import subprocess
 import sys
+import venv
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from importlib.metadata import distributions
 from typing import Tuple
+from tools._registry import register_tool
 from tools.base_tool import BaseTool
 from util.utils import Utils
 
+# .env template, encoded once for the raw os.write loop in _create_env_file
+_ENV_TEMPLATE = """# Environment Variables
+    Add your sensitive data here - never commit to version control
+    Database Configuration
+    DB_NAME=your_database_name
+    DB_USER=your_username
+    DB_PASSWORD=your_password
+    DB_HOST=localhost
+    DB_PORT=5432
+
+    Django Settings
+    DJANGO_SECRET_KEY=your-secret-key-here-change-this-in-production
+    DJANGO_DEBUG=True
+    DJANGO_ALLOWED_HOSTS=localhost,127.0.0.1
+
+    Email Configuration
+    EMAIL_HOST=smtp.gmail.com
+    EMAIL_PORT=587
+    EMAIL_USE_TLS=True
+    EMAIL_HOST_USER=your-email@gmail.com
+    EMAIL_HOST_PASSWORD=your-app-specific-password
+
+    API Keys
+    API_KEY=your_api_key_here
+    SECRET_API_KEY=your_secret_api_key_here
+
+    Application Settings
+    LOG_LEVEL=INFO
+    ENVIRONMENT=development
+    """
+# os.linesep newlines, as the text-mode write this replaced produced
+_ENV_TEMPLATE_BYTES = _ENV_TEMPLATE.replace('\n', os.linesep).encode('utf-8')
+
+
+@register_tool
 class EnvTool(BaseTool):
     """Manage virtual environments and environment files."""
 
     name = "🐍 Environment Manager"
     description = "Create/delete virtual env, create/delete .env file"
 
+    # Static menu, rendered with the header in one write per loop
+    _MENU = (
+        "\n1. Create Virtual Environment (.venv)"
+        "\n2. Delete Virtual Environment"
+        "\n3. Create .env File"
+        "\n4. Delete .env File"
+        "\n5. List Environment Variables"
+        "\n6. Check Python Environment"
+        "\n7. Back to Main Menu\n"
+    )
+
+    def __init__(self):
+        """Initialize per-session caches."""
+        self._cache = {}
+        self._env_snapshot = {}
+        self._python = sys.executable
+        self._pip_paths = {}
+
     def run(self) -> None:
         """Display environment management menu."""
+        self._env_snapshot = os.environ.copy()
         while True:
-            Utils.clear_screen()
-            Utils.print_header("ENVIRONMENT MANAGER")
-
-            print("\n1. Create Virtual Environment (.venv)")
-            print("2. Delete Virtual Environment")
-            print("3. Create .env File")
-            print("4. Delete .env File")
-            print("5. List Environment Variables")
-            print("6. Check Python Environment")
-            print("7. Back to Main Menu")
+            Utils.show_screen("ENVIRONMENT MANAGER", self._MENU)
 
             choice = input("\nSelect option (1-7): ").strip()
 
+            current_dir = os.getcwd()
+            env_path = os.path.join(current_dir, ".env")
+
             if choice == "1":
-                self._create_venv()
+                self._create_venv(current_dir)
             elif choice == "2":
-                self._delete_venv()
+                self._delete_venv(current_dir)
             elif choice == "3":
-                self._create_env_file()
+                self._create_env_file(env_path)
             elif choice == "4":
-                self._delete_env_file()
+                self._delete_env_file(env_path)
             elif choice == "5":
                 self._list_env_vars()
             elif choice == "6":
@@ -50,12 +104,15 @@ class EnvTool(BaseTool):
             if choice != "7":
                 input("\nPress Enter to continue...")
 
-    def _create_venv(self) -> None:
-        """Create a virtual environment."""
+    def _create_venv(self, current_dir: str) -> None:
+        """Create a virtual environment.
+
+        Args:
+            current_dir: Working directory to operate in.
+        """
         Utils.clear_screen()
         Utils.print_header("CREATE VIRTUAL ENVIRONMENT")
 
-        current_dir = os.getcwd()
         print(f"📂 Current directory: {current_dir}")
 
         print("\n🔧 Virtual Environment Options:")
@@ -87,14 +144,30 @@ class EnvTool(BaseTool):
             if overwrite != 'y':
                 print("❌ Operation cancelled.")
                 return
-            shutil.rmtree(venv_path, ignore_errors=True)
+            try:
+                shutil.rmtree(venv_path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"❌ Failed to remove existing environment: {e}")
+                return
 
         print(f"\n🚀 Creating virtual environment '{venv_name}'...")
 
-        # Use sys.executable to ensure using current Python
-        success, output = self._run_command([sys.executable, "-m", "venv", venv_name])
+        # Build in-process with the current Python instead of spawning `python -m venv`
+        builder = venv.EnvBuilder(
+            system_site_packages=False,
+            with_pip=True,
+            symlinks=(os.name != 'nt'),
+        )
+        try:
+            builder.create(venv_path)
+            success, output = True, ""
+        except Exception as e:
+            success, output = False, str(e)
 
         if success:
+            self._cache.clear()
             print(f"✅ Virtual environment created at: {venv_path}")
             
             # Show activation commands
@@ -113,12 +186,15 @@ class EnvTool(BaseTool):
         else:
             print(f"❌ Failed to create virtual environment: {output}")
 
-    def _delete_venv(self) -> None:
-        """Delete a virtual environment."""
+    def _delete_venv(self, current_dir: str) -> None:
+        """Delete a virtual environment.
+
+        Args:
+            current_dir: Working directory to operate in.
+        """
         Utils.clear_screen()
         Utils.print_header("DELETE VIRTUAL ENVIRONMENT")
 
-        current_dir = os.getcwd()
         print(f"📂 Current directory: {current_dir}")
 
         # Look for common venv names
@@ -147,7 +223,7 @@ class EnvTool(BaseTool):
         print("\n📁 Found virtual environments:")
         for i, (name, path) in enumerate(found_venvs, 1):
             size = self._get_folder_size(path)
-            print(f"   {i}. {name} ({self._format_size(size)})")
+            print(f"   {i}. {name} ({Utils.format_size(size, 1)})")
 
         if len(found_venvs) > 1:
             choice = input(f"\nSelect environment to delete (1-{len(found_venvs)}): ").strip()
@@ -173,19 +249,20 @@ class EnvTool(BaseTool):
             return
 
         try:
-            shutil.rmtree(venv_path, ignore_errors=True)
+            self._fast_rmtree(venv_path)
             print(f"✅ Virtual environment '{venv_name}' deleted successfully.")
         except Exception as e:
             print(f"❌ Failed to delete: {e}")
 
-    def _create_env_file(self) -> None:
-        """Create a .env file with template."""
+    def _create_env_file(self, env_path: str) -> None:
+        """Create a .env file with template.
+
+        Args:
+            env_path: Path of the .env file.
+        """
         Utils.clear_screen()
         Utils.print_header("CREATE .ENV FILE")
 
-        current_dir = os.getcwd()
-        env_path = os.path.join(current_dir, ".env")
-
         if os.path.exists(env_path):
             print("⚠️  .env file already exists.")
             overwrite = input("Overwrite? (y/n): ").lower()
@@ -196,41 +273,22 @@ class EnvTool(BaseTool):
         print("\n📝 Creating .env file with common environment variables...")
         print("   (You can edit these values after creation)")
 
-        env_template = """# Environment Variables
-    Add your sensitive data here - never commit to version control
-    Database Configuration
-    DB_NAME=your_database_name
-    DB_USER=your_username
-    DB_PASSWORD=your_password
-    DB_HOST=localhost
-    DB_PORT=5432
-
-    Django Settings
-    DJANGO_SECRET_KEY=your-secret-key-here-change-this-in-production
-    DJANGO_DEBUG=True
-    DJANGO_ALLOWED_HOSTS=localhost,127.0.0.1
-
-    Email Configuration
-    EMAIL_HOST=smtp.gmail.com
-    EMAIL_PORT=587
-    EMAIL_USE_TLS=True
-    EMAIL_HOST_USER=your-email@gmail.com
-    EMAIL_HOST_PASSWORD=your-app-specific-password
-
-    API Keys
-    API_KEY=your_api_key_here
-    SECRET_API_KEY=your_secret_api_key_here
-
-    Application Settings
-    LOG_LEVEL=INFO
-    ENVIRONMENT=development
-    """
         try:
-            with open(env_path, 'w', encoding='utf-8') as f:
-                f.write(env_template)
+            # Written until done; new files get owner-only permissions since they hold secrets
+            flags = (
+                os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+                | getattr(os, 'O_BINARY', 0) | getattr(os, 'O_NOINHERIT', 0)
+            )
+            fd = os.open(env_path, flags, 0o600)
+            try:
+                view = memoryview(_ENV_TEMPLATE_BYTES)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
             
             print(f"✅ .env file created at: {env_path}")
-            print(f"📏 File size: {os.path.getsize(env_path)} bytes")
+            print(f"📏 File size: {len(_ENV_TEMPLATE_BYTES)} bytes")
             
             # Show security warning
             print("\n⚠️  SECURITY REMINDER:")
@@ -243,35 +301,37 @@ class EnvTool(BaseTool):
             if preview == 'y':
                 print("\n📄 .env Preview:")
                 print("-" * 40)
-                with open(env_path, 'r', encoding='utf-8') as f:
-                    print(f.read())
+                print(_ENV_TEMPLATE)
                 print("-" * 40)
                 
         except Exception as e:
             print(f"❌ Failed to create .env file: {e}")
 
-    def _delete_env_file(self) -> None:
-        """Delete .env file."""
+    def _delete_env_file(self, env_path: str) -> None:
+        """Delete .env file.
+
+        Args:
+            env_path: Path of the .env file.
+        """
         Utils.clear_screen()
         Utils.print_header("DELETE .ENV FILE")
 
-        current_dir = os.getcwd()
-        env_path = os.path.join(current_dir, ".env")
-
-        if not os.path.exists(env_path):
+        # One stat serves as both the existence check and the size report
+        try:
+            st = os.stat(env_path)
+        except FileNotFoundError:
             print("❌ .env file not found in current directory.")
             return
-
-        file_size = os.path.getsize(env_path)
         print(f"📄 File: {env_path}")
-        print(f"📏 Size: {self._format_size(file_size)}")
+        print(f"📏 Size: {Utils.format_size(st.st_size, 1)}")
         
         # Show preview
         preview = input("\nShow file preview? (y/n): ").lower()
         if preview == 'y':
             try:
                 with open(env_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                    # Read one char past the limit to detect truncation
+                    content = f.read(501)
                     print("\n📄 File Content:")
                     print("-" * 40)
                     print(content[:500])  # Show first 500 chars
@@ -289,6 +349,8 @@ class EnvTool(BaseTool):
         try:
             os.remove(env_path)
             print("✅ .env file deleted successfully.")
+        except FileNotFoundError:
+            print("ℹ️  .env file was already removed.")
         except Exception as e:
             print(f"❌ Failed to delete: {e}")
 
@@ -306,26 +368,29 @@ class EnvTool(BaseTool):
             'LANG', 'PYTHON_VERSION', 'PWD', 'SHELL'
         ]
         
-        env_vars = dict(os.environ)
+        env_vars = self._env_snapshot or dict(os.environ)
         
+        # Truncate long values
+        common_lines = [
+            f"   {var}: {value[:100] + ('...' if len(value) > 100 else '')}"
+            for var in common_vars
+            if (value := env_vars.get(var)) is not None
+        ]
         print("\n🔧 Common Variables:")
-        for var in common_vars:
-            if var in env_vars:
-                value = env_vars[var]
-                # Truncate long values
-                if len(value) > 100:
-                    value = value[:100] + "..."
-                print(f"   {var}: {value}")
+        if common_lines:
+            sys.stdout.write("\n".join(common_lines) + "\n")
         
         print("\n📊 All Variables (alphabetical):")
         print("-" * 50)
         
-        for key in sorted(env_vars.keys()):
-            if key not in common_vars:  # Already shown
-                value = env_vars[key]
-                if len(value) > 50:
-                    value = value[:50] + "..."
-                print(f"   {key}: {value}")
+        common_set = set(common_vars)  # Already shown
+        other_lines = [
+            f"   {key}: {value[:50] + ('...' if len(value) > 50 else '')}"
+            for key, value in sorted(env_vars.items())
+            if key not in common_set
+        ]
+        if other_lines:
+            sys.stdout.write("\n".join(other_lines) + "\n")
         
         print(f"\n📈 Total variables: {len(env_vars)}")
 
@@ -350,24 +415,31 @@ class EnvTool(BaseTool):
 
         # Check pip version
         print("\n📦 Package Manager:")
-        success, output = self._run_command([sys.executable, "-m", "pip", "--version"])
+        success, output = self._cached_command(
+            ('pip_version', self._python), [self._python, "-m", "pip", "--version"]
+        )
         if success:
             pip_info = output.split('\n')[0] if output else "Unknown"
             print(f"   {pip_info}")
         else:
             print("   ❌ pip not available")
 
-        # List installed packages (top 10)
+        # List installed packages (top 10) from metadata, without spawning pip
         print("\n📋 Top installed packages:")
-        success, output = self._run_command([sys.executable, "-m", "pip", "list", "--format=freeze"])
-        if success and output:
-            packages = output.strip().split('\n')
-            for pkg in packages[:10]:  # Show first 10
-                print(f"   • {pkg}")
-            if len(packages) > 10:
-                print(f"   ... and {len(packages) - 10} more")
+        # Like pip list: first match on sys.path wins, sorted case-insensitively
+        packages = {}
+        for dist in distributions():
+            name = dist.metadata["Name"]
+            if name:
+                packages.setdefault(name.lower(), f"{name}=={dist.version}")
+        if packages:
+            names = sorted(packages)
+            for key in names[:10]:  # Show first 10
+                print(f"   • {packages[key]}")
+            if len(names) > 10:
+                print(f"   ... and {len(names) - 10} more")
         else:
-            print("   ℹ️  No packages found or pip error")
+            print("   ℹ️  No packages found")
 
     def _install_requirements(self, venv_path: str, req_file: str) -> None:
         """Install requirements in virtual environment.
@@ -378,24 +450,83 @@ class EnvTool(BaseTool):
         """
         print(f"\n📦 Installing packages from {req_file}...")
         
-        # Determine pip path based on OS
-        if os.name == 'nt':  # Windows
-            pip_path = os.path.join(venv_path, "Scripts", "pip")
-        else:  # Unix/Linux/Mac
-            pip_path = os.path.join(venv_path, "bin", "pip")
-        
-        success, output = self._run_command([pip_path, "install", "-r", req_file])
+        pip_path = self._venv_pip(venv_path)
+        success, output = self._run_command_streaming([pip_path, "install", "-r", req_file])
         
         if success:
+            self._cache.clear()
             print("✅ Requirements installed successfully!")
-            if output:
-                # Show last few lines of output
-                lines = output.strip().split('\n')
-                if len(lines) > 5:
-                    print("\n".join(lines[-5:]))
         else:
             print(f"❌ Failed to install requirements: {output}")
 
+    def _fast_rmtree(self, path: str) -> None:
+        """Delete a directory tree, unlinking each folder's files in inode order.
+
+        Memory stays proportional to one directory's entries, not the tree.
+        Removing entries in inode order keeps large deletes linear on ext3/ext4,
+        where directory-order removal can degrade quadratically. Like
+        shutil.rmtree(ignore_errors=True), entries that can't be removed are
+        skipped, and a symlinked root is never followed.
+
+        Args:
+            path: Directory to delete.
+
+        Raises:
+            OSError: If path is a symlink rather than a directory.
+        """
+        if stat.S_ISLNK(os.lstat(path).st_mode):
+            raise OSError(f"Refusing to delete symlinked folder: {path}")
+
+        if os.name == 'nt':  # Inode order is meaningless on NTFS
+            shutil.rmtree(path, ignore_errors=True)
+            return
+
+        self._rmtree_entries(path)
+        try:
+            os.rmdir(path)
+        except OSError:
+            pass
+
+    def _rmtree_entries(self, path: str) -> None:
+        """Remove everything inside a real directory, skipping failed entries.
+
+        Args:
+            path: Directory to empty.
+        """
+        # Only this folder's listing is held; files go before recursing so
+        # ancestors keep just their subdirectory paths on the stack
+        files = []
+        subdirs = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        subdirs.append(entry.path)
+                    else:
+                        # Symlinks land here and are unlinked, never followed
+                        files.append((entry.inode(), entry.path))
+        except OSError:
+            return
+
+        files.sort()
+        for _, file_path in files:
+            try:
+                os.unlink(file_path)
+            except OSError:
+                continue
+        del files
+
+        for subdir in subdirs:
+            self._rmtree_entries(subdir)
+            try:
+                os.rmdir(subdir)
+            except OSError:
+                continue
+
     def _get_folder_size(self, folder_path: str) -> int:
         """Calculate folder size in bytes.
         
@@ -406,28 +537,113 @@ class EnvTool(BaseTool):
             Size in bytes.
         """
         total_size = 0
-        for dirpath, dirnames, filenames in os.walk(folder_path):
-            for filename in filenames:
-                filepath = os.path.join(dirpath, filename)
-                if os.path.exists(filepath):
-                    total_size += os.path.getsize(filepath)
+        # stat() latency dominates on cold or network storage, so overlap it
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = {executor.submit(self._scan_dir_size, folder_path)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    size, subdirs = future.result()
+                    total_size += size
+                    pending.update(executor.submit(self._scan_dir_size, d) for d in subdirs)
         return total_size
 
     @staticmethod
-    def _format_size(size_bytes: int) -> str:
-        """Format size in human readable format.
+    def _scan_dir_size(dir_path: str) -> Tuple[int, list]:
+        """Sum file sizes in one directory and collect its subdirectories.
         
         Args:
-            size_bytes: Size in bytes.
+            dir_path: Directory to scan.
             
         Returns:
-            Formatted size string.
+            (size of files in bytes, list of subdirectory paths)
+        """
+        size = 0
+        subdirs = []
+        try:
+            entries = os.scandir(dir_path)
+        except OSError:
+            return size, subdirs
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    else:
+                        size += entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    continue
+        return size, subdirs
+
+    def _venv_pip(self, venv_path: str) -> str:
+        """Resolve the absolute pip path of a virtual environment once.
+        
+        Args:
+            venv_path: Path to virtual environment.
+            
+        Returns:
+            Absolute path to the venv's pip executable.
+        """
+        pip_path = self._pip_paths.get(venv_path)
+        if pip_path is None:
+            # Determine pip path based on OS
+            if os.name == 'nt':  # Windows
+                pip_path = os.path.join(os.path.abspath(venv_path), "Scripts", "pip")
+            else:  # Unix/Linux/Mac
+                pip_path = os.path.join(os.path.abspath(venv_path), "bin", "pip")
+            self._pip_paths[venv_path] = pip_path
+        return pip_path
+
+    def _cached_command(self, key: tuple, cmd: list) -> Tuple[bool, str]:
+        """Run a command once per session, reusing its successful output.
+
+        Args:
+            key: Cache key, e.g. ('pip_list', sys.executable).
+            cmd: Command list.
+
+        Returns:
+            (success, output)
         """
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.1f} TB"
+        if key in self._cache:
+            return True, self._cache[key]
+        success, output = self._run_command(cmd)
+        if success:
+            self._cache[key] = output
+        return success, output
+
+    def _run_command_streaming(self, cmd: list) -> Tuple[bool, str]:
+        """Run a command, echoing its output line by line as it arrives.
+
+        Args:
+            cmd: Command list.
+
+        Returns:
+            (success, last few output lines)
+        """
+        tail = deque(maxlen=5)
+        try:
+            with subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                encoding='utf-8',
+                errors='ignore',
+                bufsize=1
+            ) as proc:
+                for line in proc.stdout:
+                    print(f"   {line}", end='')
+                    tail.append(line.rstrip())
+        except FileNotFoundError:
+            return False, f"Command not found: {' '.join(cmd)}"
+        except Exception as e:
+            return False, str(e)
+
+        output = "\n".join(tail)
+        if proc.returncode == 0:
+            return True, output
+        return False, output or "Unknown error"
 
     def _run_command(self, cmd: list, shell: bool = False) -> Tuple[bool, str]:
         """Run a shell command.
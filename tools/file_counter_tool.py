@@ -1,10 +1,13 @@
 """Tool to count files and folders by type."""
 
 import os
-from collections import defaultdict
+import sys
+from collections import Counter
+from tools._registry import register_tool
 from tools.base_tool import BaseTool
 from util.utils import Utils
 
+@register_tool
 class FileCounterTool(BaseTool):
     """Count files and folders by type."""
 
@@ -18,27 +21,58 @@ class FileCounterTool(BaseTool):
 
         project_path = Utils.get_project_path()
 
-        file_stats = defaultdict(int)
-        total_files = 0
-        total_dirs = 0
+        include_all = input(
+            "Include virtualenv/VCS folders (.venv, .git, ...)? (y/N): "
+        ).strip().lower() == "y"
 
-        for root, dirs, files in os.walk(project_path):
-            total_dirs += len(dirs)
-            total_files += len(files)
-            for file in files:
-                ext = os.path.splitext(file)[1].lower()
-                file_stats[ext] += 1
+        file_stats, total_files, total_dirs, skipped = self._scan(project_path, prune=not include_all)
 
         print(f"\n📁 Project: {os.path.basename(project_path)}")
         print(f"📍 Path: {project_path}")
         print("\n📈 Statistics:")
         print(f"   • Total folders: {total_dirs}")
         print(f"   • Total files: {total_files}")
+        if skipped:
+            print(f"   • Skipped folders (venv/VCS): {skipped}")
 
         print("\n📄 Files by extension:")
-        for ext, count in sorted(file_stats.items(), key=lambda x: x[1], reverse=True):
-            ext_display = ext if ext else "[no extension]"
-            print(f"   • {ext_display}: {count}")
+        lines = [
+            f"   • {ext or '[no extension]'}: {count}"
+            for ext, count in file_stats.most_common()
+        ]
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
 
         input("\nPress Enter to continue...")
-        
\ No newline at end of file
+
+    @staticmethod
+    def _scan(project_path: str, prune: bool = True) -> tuple:
+        """Count folders and files by extension in one walk.
+
+        Args:
+            project_path (str): Root directory to scan.
+            prune (bool): Skip VCS folders and virtualenvs.
+
+        Returns:
+            tuple: (extension counts, total files, total folders, skipped folders).
+        """
+        file_stats = Counter()
+        total_files = 0
+        total_dirs = 0
+        skipped = 0
+
+        # Like os.walk's default, symlinked folders are counted but not followed
+        for _, dirs, files in os.walk(project_path):
+            if prune:
+                skipped += Utils.prune_walk_dirs(dirs, files)
+            total_dirs += len(dirs)
+            total_files += len(files)
+            for name in files:
+                dot = name.rfind(".")
+                # Leading dots don't start an extension (".gitignore" has none)
+                if dot > 0 and name[:dot].strip("."):
+                    file_stats[name[dot:].lower()] += 1
+                else:
+                    file_stats[""] += 1
+
+        return file_stats, total_files, total_dirs, skipped
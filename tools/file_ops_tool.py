@@ -1,35 +1,236 @@
 """Tool for file and folder operations."""
 
+import csv
+import fnmatch
 import os
+import re
 import shutil
 import stat
+import subprocess
+import sys
 import time
+from array import array
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Iterator, List, Tuple, Optional
+from tools._registry import register_tool
 from tools.base_tool import BaseTool
 from util.utils import Utils
 
+try:
+    import grp
+    import pwd
+except ImportError:  # Windows
+    grp = pwd = None
 
+try:
+    import pyperclip
+except ImportError:  # Optional; fall back to the platform clipboard command
+    pyperclip = None
+
+# Upper bound on directory listings queued in the scan thread pool
+_MAX_PENDING_SCANS = 256
+
+# os.fwalk and dir_fd-relative stat are POSIX-only
+_HAS_FWALK = hasattr(os, "fwalk") and os.stat in os.supports_dir_fd
+
+# Clipboard command used without pyperclip, resolved once per process
+if os.name == "nt":
+    _CLIPBOARD_CMD = ["clip"]
+elif sys.platform == "darwin":
+    _CLIPBOARD_CMD = ["pbcopy"]
+elif "WAYLAND_DISPLAY" in os.environ:
+    _CLIPBOARD_CMD = ["wl-copy"]
+else:
+    _CLIPBOARD_CMD = ["xclip", "-selection", "clipboard"]
+
+
+def _as_prefix(path: str) -> str:
+    """Normalize a path for prefix checks, ending it with a separator.
+
+    The trailing separator stops "/home/al" from matching "/home/alice".
+
+    Args:
+        path: Path to normalize.
+
+    Returns:
+        Normalized path ending in os.sep.
+    """
+    path = os.path.normcase(os.path.normpath(path))
+    return path if path.endswith(os.sep) else path + os.sep
+
+
+# Paths whose contents always get the stronger delete confirmation
+_IMPORTANT_PREFIXES = tuple(
+    _as_prefix(p) for p in (os.path.expanduser("~"), "/", "C:\\")
+)
+
+# Menu options that modify files, invalidating cached scans
+_MUTATING_CHOICES = frozenset("23467")
+
+_IMPORT_RE = re.compile(r"^\s*(import|from)\s+(\w+)", re.MULTILINE)
+
+
+@lru_cache(maxsize=256)
+def _owner_name(uid: int) -> Optional[str]:
+    """Look up a user name by UID (cached; most files share a few owners).
+
+    Args:
+        uid: User ID.
+
+    Returns:
+        User name, or None if the UID is unknown.
+    """
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except KeyError:
+        return None
+
+
+@lru_cache(maxsize=256)
+def _group_name(gid: int) -> Optional[str]:
+    """Look up a group name by GID (cached; most files share a few groups).
+
+    Args:
+        gid: Group ID.
+
+    Returns:
+        Group name, or None if the GID is unknown.
+    """
+    try:
+        return grp.getgrgid(gid).gr_name
+    except KeyError:
+        return None
+
+
+class FileList:
+    """Scanned files stored as parallel columns instead of one dict per file."""
+
+    __slots__ = ("paths", "sizes", "full_paths", "_lower_paths", "_size_strs")
+
+    def __init__(self):
+        """Initialize empty columns."""
+        self.paths: List[str] = []
+        self.sizes = array("q")
+        self.full_paths: List[str] = []
+        self._lower_paths: Optional[List[str]] = None
+        self._size_strs: Optional[List[str]] = None
+
+    def __len__(self) -> int:
+        """Return the number of files."""
+        return len(self.paths)
+
+    def append(self, path: str, size: int, full_path: str) -> None:
+        """Add one file.
+
+        Args:
+            path: Path relative to the scanned directory.
+            size: Size in bytes.
+            full_path: Absolute path.
+        """
+        self.paths.append(path)
+        self.sizes.append(size)
+        self.full_paths.append(full_path)
+        self._lower_paths = None
+        self._size_strs = None
+
+    def lower_paths(self) -> List[str]:
+        """Get lowercased paths for case-insensitive matching (cached).
+
+        Returns:
+            Lowercased paths, aligned with paths.
+        """
+        if self._lower_paths is None:
+            self._lower_paths = [p.lower() for p in self.paths]
+        return self._lower_paths
+
+    def size_strs(self) -> List[str]:
+        """Get human readable sizes (cached).
+
+        Returns:
+            Formatted sizes, aligned with paths.
+        """
+        if self._size_strs is None:
+            self._size_strs = [Utils.format_size(size) for size in self.sizes]
+        return self._size_strs
+
+    @classmethod
+    def from_rows(cls, rows: List[Tuple[str, int, str]]) -> "FileList":
+        """Build a list from (path, size, full_path) rows.
+
+        Args:
+            rows: File rows.
+
+        Returns:
+            New FileList.
+        """
+        result = cls()
+        if rows:
+            paths, sizes, full_paths = zip(*rows)
+            result.paths = list(paths)
+            result.sizes = array("q", sizes)
+            result.full_paths = list(full_paths)
+        return result
+
+    def sorted_by_path(self) -> "FileList":
+        """Return a copy ordered by relative path.
+
+        Paths are unique, so sorting the row tuples orders by path without
+        calling back into Python for a key.
+
+        Returns:
+            New FileList.
+        """
+        return FileList.from_rows(sorted(zip(self.paths, self.sizes, self.full_paths)))
+
+    def take(self, indices: List[int]) -> "FileList":
+        """Build a new list from the given row indices, in that order.
+
+        Args:
+            indices: Row indices to keep.
+
+        Returns:
+            New FileList.
+        """
+        result = FileList()
+        paths, sizes, full_paths = self.paths, self.sizes, self.full_paths
+        result.paths = [paths[i] for i in indices]
+        result.sizes = array("q", [sizes[i] for i in indices])
+        result.full_paths = [full_paths[i] for i in indices]
+        return result
+
+
+@register_tool
 class FileOperationsTool(BaseTool):
     """Perform file and folder operations."""
 
     name = "📁 File Operations"
     description = "List, copy, move, delete files and folders"
 
+    # Static menu, rendered with the header in one write per loop
+    _MENU = (
+        "\n1. List all project files (for copy path)"
+        "\n2. Copy file/folder"
+        "\n3. Move file/folder"
+        "\n4. Delete file/folder"
+        "\n5. File information"
+        "\n6. Create new folder"
+        "\n7. Create new file"
+        "\n8. Back to Main Menu\n"
+    )
+
+    def __init__(self):
+        """Initialize per-session state."""
+        # Last scan per directory: (scan time, files in scan order)
+        self._scan_cache: dict[str, Tuple[float, FileList]] = {}
+
     def run(self) -> None:
         """Display file operations menu."""
         while True:
-            Utils.clear_screen()
-            Utils.print_header("FILE OPERATIONS")
-
-            print("\n1. List all project files (for copy path)")
-            print("2. Copy file/folder")
-            print("3. Move file/folder")
-            print("4. Delete file/folder")
-            print("5. File information")
-            print("6. Create new folder")
-            print("7. Create new file")
-            print("8. Back to Main Menu")
+            Utils.show_screen("FILE OPERATIONS", self._MENU)
 
             choice = input("\nSelect option (1-8): ").strip()
 
@@ -52,6 +253,10 @@ class FileOperationsTool(BaseTool):
             else:
                 print("❌ Invalid option")
 
+            # Copy, move, delete and create change the tree; drop cached scans
+            if choice in _MUTATING_CHOICES:
+                self._scan_cache.clear()
+
             if choice != "8":
                 input("\nPress Enter to continue...")
 
@@ -63,40 +268,15 @@ class FileOperationsTool(BaseTool):
         current_dir = os.getcwd()
         print(f"📍 Current directory: {current_dir}")
 
-        print("\n🔍 Scanning files...")
-
-        # Get list of all files
-        all_files = []
-        total_size = 0
-
-        for root, dirs, files in os.walk(current_dir):
-            # Skip hidden directories
-            dirs[:] = [d for d in dirs if not d.startswith(".")]
-
-            for file in files:
-                if file.startswith("."):
-                    continue
-
-                file_path = os.path.join(root, file)
-                try:
-                    file_size = os.path.getsize(file_path)
-                    rel_path = os.path.relpath(file_path, current_dir)
-
-                    all_files.append(
-                        {"path": rel_path, "size": file_size, "full_path": file_path}
-                    )
-                    total_size += file_size
-                except (OSError, PermissionError):
-                    continue
+        all_files = self._get_scan(current_dir)
 
         if not all_files:
             print("❌ No files found.")
             return
 
-        # Sort files by path
-        all_files.sort(key=lambda x: x["path"])
+        total_size = sum(all_files.sizes)
 
-        print(f"\n📊 Found {len(all_files)} files ({self._format_size(total_size)})")
+        print(f"\n📊 Found {len(all_files)} files ({Utils.format_size(total_size)})")
 
         # Display options
         print("\n📋 Display options:")
@@ -107,37 +287,132 @@ class FileOperationsTool(BaseTool):
 
         display_choice = input("\nSelect option (1-4): ").strip()
 
+        # Search sorts only its matches; every other view needs the full order
+        if display_choice == "3":
+            self._search_files(all_files)
+            return
+        all_files = all_files.sorted_by_path()
+
         if display_choice == "1":
             self._show_files_with_details(all_files)
         elif display_choice == "2":
             self._show_file_paths_only(all_files)
-        elif display_choice == "3":
-            self._search_files(all_files)
         elif display_choice == "4":
             self._export_file_list(all_files, current_dir)
         else:
             self._show_files_with_details(all_files)
 
-    def _show_files_with_details(self, files: List[dict]) -> None:
-        """Show files with detailed information.
+    def _get_scan(self, current_dir: str) -> FileList:
+        """Scan a directory, offering to reuse this session's previous scan.
 
         Args:
-            files: List of file dictionaries.
+            current_dir: Directory to scan.
+
+        Returns:
+            Files in scan order.
         """
-        print("\n📄 Files with details:")
-        print("-" * 80)
-        print(f"{'No.':<4} {'Size':<10} {'Path'}")
-        print("-" * 80)
-
-        for idx, file_info in enumerate(files, 1):
-            if idx <= 100:  # Show first 100 files
-                size_str = self._format_size(file_info["size"])
-                print(f"{idx:<4} {size_str:<10} {file_info['path']}")
-            else:
-                print(f"... and {len(files) - 100} more files")
-                break
+        cached = self._scan_cache.get(current_dir)
+        if cached is not None:
+            scanned_at, files = cached
+            when = time.strftime("%H:%M:%S", time.localtime(scanned_at))
+            reuse = input(
+                f"\n♻️  Reuse scan from {when} ({len(files)} files)? (Y/n): "
+            ).strip().lower()
+            if reuse in ("", "y"):
+                return files
+
+        print("\n🔍 Scanning files...")
+
+        # Get list of all files
+        files = FileList()
+        for rel_path, file_size, file_path in self._scan_tree(current_dir):
+            files.append(rel_path, file_size, file_path)
 
-        print("-" * 80)
+        self._scan_cache[current_dir] = (time.time(), files)
+        return files
+
+    @classmethod
+    def _scan_tree(cls, root: str) -> Iterator[Tuple[str, int, str]]:
+        """Walk a tree with os.scandir, skipping hidden files and folders.
+
+        Directories are listed on a thread pool so their scandir/stat calls
+        overlap; at most _MAX_PENDING_SCANS listings are in flight at once.
+
+        Args:
+            root: Directory to scan.
+
+        Yields:
+            (relative path, size in bytes, full path) for each visible file.
+        """
+        backlog = deque([(root, "")])
+        pending = set()
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while backlog or pending:
+                while backlog and len(pending) < _MAX_PENDING_SCANS:
+                    pending.add(executor.submit(cls._scan_dir, *backlog.popleft()))
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    subdirs, files = future.result()
+                    backlog.extend(subdirs)
+                    yield from files
+
+    @staticmethod
+    def _scan_dir(dir_path: str, rel_prefix: str) -> Tuple[list, list]:
+        """List one directory for _scan_tree.
+
+        Relative paths are built by extending the folder's prefix instead of
+        calling os.path.relpath per file.
+
+        Args:
+            dir_path: Directory to list.
+            rel_prefix: Relative path of the directory, ending in os.sep.
+
+        Returns:
+            (subdirectories as (path, rel_prefix), files as (rel_path, size, full_path))
+        """
+        subdirs = []
+        files = []
+        try:
+            entries = os.scandir(dir_path)
+        except OSError:
+            return subdirs, files
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith("."):
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append((entry.path, rel_prefix + name + os.sep))
+                    elif entry.is_file():
+                        files.append((rel_prefix + name, entry.stat().st_size, entry.path))
+                except OSError:
+                    continue
+        return subdirs, files
+
+    def _show_files_with_details(self, files: FileList) -> None:
+        """Show files with detailed information.
+
+        Args:
+            files: Scanned files.
+        """
+        # Build the table and write it in one call
+        lines = [
+            "\n📄 Files with details:",
+            "-" * 80,
+            f"{'No.':<4} {'Size':<10} {'Path'}",
+            "-" * 80,
+        ]
+        # Show first 100 files
+        lines.extend(
+            f"{idx:<4} {Utils.format_size(size):<10} {path}"
+            for idx, (path, size) in enumerate(zip(files.paths[:100], files.sizes[:100]), 1)
+        )
+        if len(files) > 100:
+            lines.append(f"... and {len(files) - 100} more files")
+        lines.append("-" * 80)
+        sys.stdout.write("\n".join(lines) + "\n")
 
         if len(files) > 0:
             print("\n📋 Copy options:")
@@ -156,41 +431,37 @@ class FileOperationsTool(BaseTool):
                 elif choice.isdigit():
                     idx = int(choice) - 1
                     if 0 <= idx < len(files):
-                        self._copy_to_clipboard(files[idx]["path"])
-                        print(f"✅ Copied: {files[idx]['path']}")
+                        self._copy_to_clipboard(files.paths[idx])
+                        print(f"✅ Copied: {files.paths[idx]}")
                     else:
                         print("❌ Invalid file number")
                 else:
                     print("❌ Invalid input")
 
-    def _show_file_paths_only(self, files: List[dict]) -> None:
+    def _show_file_paths_only(self, files: FileList) -> None:
         """Show only file paths for easy copying.
 
         Args:
-            files: List of file dictionaries.
+            files: Scanned files.
         """
-        print("\n📄 File paths only:")
-        print("-" * 60)
-
-        for idx, file_info in enumerate(files, 1):
-            if idx <= 50:  # Show first 50 files
-                print(f"{file_info['path']}")
-            else:
-                print(f"... and {len(files) - 50} more files")
-                break
-
-        print("-" * 60)
+        # Build the listing and write it in one call
+        lines = ["\n📄 File paths only:", "-" * 60]
+        lines.extend(files.paths[:50])  # Show first 50 files
+        if len(files) > 50:
+            lines.append(f"... and {len(files) - 50} more files")
+        lines.append("-" * 60)
+        sys.stdout.write("\n".join(lines) + "\n")
 
         if len(files) > 0:
             copy_all = input("\n📋 Copy all paths to file? (y/n): ").lower()
             if copy_all == "y":
                 self._copy_all_paths(files)
 
-    def _search_files(self, files: List[dict]) -> None:
+    def _search_files(self, files: FileList) -> None:
         """Search for files by name or extension.
 
         Args:
-            files: List of file dictionaries.
+            files: Scanned files, in any order; matches are sorted by path.
         """
         print("\n🔍 Search files:")
         print("1. Search by filename")
@@ -200,14 +471,25 @@ class FileOperationsTool(BaseTool):
         search_choice = input("\nSelect search type (1-3): ").strip()
 
         if search_choice == "1":
-            search_term = input("Enter filename or part of filename: ").strip().lower()
-            results = [f for f in files if search_term in f["path"].lower()]
+            search_term = input(
+                "Enter filename or part of filename (* and ? wildcards allowed): "
+            ).strip().lower()
+            if "*" in search_term or "?" in search_term:
+                # Compile the glob once; it is matched against the file name only,
+                # so "test_*.py" finds files in any folder
+                match = re.compile(fnmatch.translate(search_term)).match
+                basename = os.path.basename
+                results = [
+                    i for i, p in enumerate(files.lower_paths()) if match(basename(p))
+                ]
+            else:
+                results = [i for i, p in enumerate(files.lower_paths()) if search_term in p]
             title = f"Files containing '{search_term}'"
         elif search_choice == "2":
             extension = input("Enter extension (e.g., .py, .txt): ").strip().lower()
             if not extension.startswith("."):
                 extension = "." + extension
-            results = [f for f in files if f["path"].lower().endswith(extension)]
+            results = [i for i, p in enumerate(files.lower_paths()) if p.endswith(extension)]
             title = f"Files with extension '{extension}'"
         elif search_choice == "3":
             try:
@@ -223,7 +505,7 @@ class FileOperationsTool(BaseTool):
                     else float("inf")
                 )
 
-                results = [f for f in files if min_bytes <= f["size"] <= max_bytes]
+                results = [i for i, sz in enumerate(files.sizes) if min_bytes <= sz <= max_bytes]
                 title = f"Files between {min_size or 0}KB and {max_size or '∞'}KB"
             except ValueError:
                 print("❌ Invalid size input")
@@ -237,13 +519,13 @@ class FileOperationsTool(BaseTool):
             return
 
         print(f"\n📊 {title}: {len(results)} files found")
-        self._show_files_with_details(results)
+        self._show_files_with_details(files.take(results).sorted_by_path())
 
-    def _export_file_list(self, files: List[dict], current_dir: str) -> None:
+    def _export_file_list(self, files: FileList, current_dir: str) -> None:
         """Export file list to a text file.
 
         Args:
-            files: List of file dictionaries.
+            files: Scanned files.
             current_dir: Current working directory.
         """
         filename = input("\nEnter output filename [file_list.txt]: ").strip()
@@ -258,44 +540,40 @@ class FileOperationsTool(BaseTool):
         format_choice = input("\nSelect format (1-3): ").strip()
 
         try:
-            with open(filename, "w", encoding="utf-8") as f:
+            # Large buffer so the listing reaches the OS in a few big writes
+            with open(filename, "w", encoding="utf-8", buffering=1 << 20) as f:
                 f.write(f"File list for: {current_dir}\n")
                 f.write(f"Generated on: {self._get_current_timestamp()}\n")
                 f.write(f"Total files: {len(files)}\n")
                 f.write(
-                    f"Total size: {self._format_size(sum(f['size'] for f in files))}\n"
+                    f"Total size: {Utils.format_size(sum(files.sizes))}\n"
                 )
                 f.write("=" * 80 + "\n\n")
 
-                if format_choice == "1":
-                    for file_info in files:
-                        f.write(f"{file_info['path']}\n")
-                elif format_choice == "2":
-                    for file_info in files:
-                        size_str = self._format_size(file_info["size"])
-                        f.write(f"{size_str:<12} {file_info['path']}\n")
+                if format_choice == "2":
+                    f.writelines(
+                        f"{size_str:<12} {path}\n"
+                        for path, size_str in zip(files.paths, files.size_strs())
+                    )
                 elif format_choice == "3":
                     f.write("Path,Size(bytes),Size(human)\n")
-                    for file_info in files:
-                        size_str = self._format_size(file_info["size"])
-                        # Escape quotes in path
-                        path_escaped = file_info["path"].replace('"', '""')
-                        f.write(f'"{path_escaped}",{file_info["size"]},"{size_str}"\n')
+                    # Quoting non-numeric fields keeps the original "path",size,"size" layout
+                    writer = csv.writer(f, quoting=csv.QUOTE_NONNUMERIC, lineterminator="\n")
+                    writer.writerows(zip(files.paths, files.sizes, files.size_strs()))
                 else:
-                    for file_info in files:
-                        f.write(f"{file_info['path']}\n")
+                    f.writelines(f"{path}\n" for path in files.paths)
 
             print(f"✅ File list exported to: {os.path.abspath(filename)}")
-            print(f"📏 File size: {self._format_size(os.path.getsize(filename))}")
+            print(f"📏 File size: {Utils.format_size(os.path.getsize(filename))}")
 
         except Exception as e:
             print(f"❌ Failed to export file list: {e}")
 
-    def _copy_all_paths(self, files: List[dict]) -> None:
+    def _copy_all_paths(self, files: FileList) -> None:
         """Copy all file paths to clipboard or file.
 
         Args:
-            files: List of file dictionaries.
+            files: Scanned files.
         """
         print("\n📋 Copy all paths:")
         print("1. Copy to clipboard (if supported)")
@@ -304,7 +582,7 @@ class FileOperationsTool(BaseTool):
 
         copy_choice = input("\nSelect option (1-3): ").strip()
 
-        all_paths = "\n".join(f["path"] for f in files)
+        all_paths = "\n".join(files.paths)
 
         if copy_choice == "1":
             success = self._copy_to_clipboard(all_paths)
@@ -349,14 +627,18 @@ class FileOperationsTool(BaseTool):
         if not os.path.isabs(source):
             source = os.path.join(current_dir, source)
 
-        if not os.path.exists(source):
+        # One stat answers existence, type and file size
+        try:
+            source_st = os.stat(source)
+        except OSError:
             print(f"❌ Source not found: {source}")
             return
+        source_is_file = stat.S_ISREG(source_st.st_mode)
 
         # Suggest destination
         dest_dir = (
             os.path.dirname(source)
-            if os.path.isfile(source)
+            if source_is_file
             else os.path.dirname(os.path.dirname(source))
         )
         dest_suggestion = os.path.join(dest_dir, f"copy_of_{os.path.basename(source)}")
@@ -378,29 +660,27 @@ class FileOperationsTool(BaseTool):
                 print("❌ Operation cancelled.")
                 return
             elif action == "r":
-                base, ext = os.path.splitext(dest)
-                counter = 1
-                while os.path.exists(f"{base}_{counter}{ext}"):
-                    counter += 1
-                dest = f"{base}_{counter}{ext}"
+                dest = self._next_free_name(dest)
                 print(f"📝 New destination: {dest}")
 
-        # Confirm copy
-        source_size = self._get_path_size(source)
+        # Confirm copy; folder sizes need a full walk, so only on request
+        source_size = source_st.st_size if source_is_file else None
         print(f"\n📋 Copy details:")
         print(f"   Source: {source}")
         print(f"   Destination: {dest}")
-        print(f"   Size: {self._format_size(source_size)}")
-        print(f"   Type: {'File' if os.path.isfile(source) else 'Folder'}")
+        print(f"   Size: {Utils.format_size(source_size) if source_is_file else '(not calculated)'}")
+        print(f"   Type: {'File' if source_is_file else 'Folder'}")
 
-        confirm = input("\n📝 Confirm copy? (y/n): ").lower()
-        if confirm != "y":
+        confirmed, source_size = self._confirm_with_size(
+            "\n📝 Confirm copy?", source, source_st, source_size
+        )
+        if not confirmed:
             print("❌ Operation cancelled.")
             return
 
         # Perform copy
         try:
-            if os.path.isfile(source):
+            if source_is_file:
                 shutil.copy2(source, dest)  # copy2 preserves metadata
                 print(f"✅ File copied successfully!")
             else:
@@ -410,13 +690,44 @@ class FileOperationsTool(BaseTool):
             # Verify
             if os.path.exists(dest):
                 dest_size = self._get_path_size(dest)
-                print(
-                    f"📏 Verification: Source {self._format_size(source_size)} -> Destination {self._format_size(dest_size)}"
-                )
+                if source_size is None:
+                    print(f"📏 Verification: Destination {Utils.format_size(dest_size)}")
+                else:
+                    print(
+                        f"📏 Verification: Source {Utils.format_size(source_size)} -> Destination {Utils.format_size(dest_size)}"
+                    )
 
         except Exception as e:
             print(f"❌ Copy failed: {e}")
 
+    def _confirm_with_size(
+        self,
+        prompt: str,
+        source: str,
+        source_st: os.stat_result,
+        source_size: Optional[int],
+    ) -> Tuple[bool, Optional[int]]:
+        """Ask for confirmation, offering to calculate a deferred folder size.
+
+        Args:
+            prompt: Confirmation question.
+            source: Source path.
+            source_st: Result of os.stat(source).
+            source_size: Known size in bytes, or None if not calculated yet.
+
+        Returns:
+            (confirmed, size in bytes or None if still not calculated)
+        """
+        if source_size is not None:
+            return input(f"{prompt} (y/n): ").lower() == "y", source_size
+
+        choice = input(f"{prompt} (y/n, s = show size first): ").lower()
+        if choice == "s":
+            source_size = self._get_path_size(source, source_st)
+            print(f"   Size: {Utils.format_size(source_size)}")
+            choice = input(f"{prompt} (y/n): ").lower()
+        return choice == "y", source_size
+
     def _move_file_folder(self) -> None:
         """Move a file or folder."""
         Utils.clear_screen()
@@ -434,9 +745,13 @@ class FileOperationsTool(BaseTool):
         if not os.path.isabs(source):
             source = os.path.join(current_dir, source)
 
-        if not os.path.exists(source):
+        # One stat answers existence, type and file size
+        try:
+            source_st = os.stat(source)
+        except OSError:
             print(f"❌ Source not found: {source}")
             return
+        source_is_file = stat.S_ISREG(source_st.st_mode)
 
         # Get destination directory
         dest_dir = input("Enter destination directory: ").strip()
@@ -476,23 +791,21 @@ class FileOperationsTool(BaseTool):
                 print("❌ Operation cancelled.")
                 return
             elif action == "r":
-                base, ext = os.path.splitext(dest)
-                counter = 1
-                while os.path.exists(f"{base}_{counter}{ext}"):
-                    counter += 1
-                dest = f"{base}_{counter}{ext}"
+                dest = self._next_free_name(dest)
                 print(f"📝 New destination: {dest}")
 
-        # Confirm move
-        source_size = self._get_path_size(source)
+        # Confirm move; folder sizes need a full walk, so only on request
+        source_size = source_st.st_size if source_is_file else None
         print(f"\n📋 Move details:")
         print(f"   Source: {source}")
         print(f"   Destination: {dest}")
-        print(f"   Size: {self._format_size(source_size)}")
-        print(f"   Type: {'File' if os.path.isfile(source) else 'Folder'}")
+        print(f"   Size: {Utils.format_size(source_size) if source_is_file else '(not calculated)'}")
+        print(f"   Type: {'File' if source_is_file else 'Folder'}")
 
-        confirm = input("\n⚠️  Confirm move? (y/n): ").lower()
-        if confirm != "y":
+        confirmed, source_size = self._confirm_with_size(
+            "\n⚠️  Confirm move?", source, source_st, source_size
+        )
+        if not confirmed:
             print("❌ Operation cancelled.")
             return
 
@@ -527,40 +840,37 @@ class FileOperationsTool(BaseTool):
         if not os.path.isabs(target):
             target = os.path.join(current_dir, target)
 
-        if not os.path.exists(target):
+        # One stat answers existence, type, size and modification time
+        try:
+            target_st = os.stat(target)
+        except OSError:
             print(f"❌ Path not found: {target}")
             return
 
-        # Get information about the target
-        is_file = os.path.isfile(target)
-        size = self._get_path_size(target)
-        modified = time.ctime(os.path.getmtime(target))
+        # Get information about the target; folders are counted and sized in one walk
+        is_file = stat.S_ISREG(target_st.st_mode)
+        if is_file:
+            size = target_st.st_size
+        else:
+            file_count, folder_count, size = self._tree_totals(target)
+        modified = time.ctime(target_st.st_mtime)
 
         print(f"\n📋 Target information:")
         print(f"   Path: {target}")
         print(f"   Type: {'File' if is_file else 'Folder'}")
-        print(f"   Size: {self._format_size(size)}")
+        print(f"   Size: {Utils.format_size(size)}")
         print(f"   Modified: {modified}")
 
         if not is_file:
-            # Count contents for folders
-            try:
-                file_count = sum(len(files) for _, _, files in os.walk(target))
-                folder_count = sum(len(dirs) for _, dirs, _ in os.walk(target))
-                print(f"   Contains: {file_count} files, {folder_count} folders")
-            except:
-                pass
+            print(f"   Contains: {file_count} files, {folder_count} folders")
 
         # Safety check - prevent deleting important paths
-        important_paths = [
-            os.path.expanduser("~"),
-            "/",
-            "C:\\",
-            os.getcwd(),
-            os.path.dirname(os.getcwd()),
-        ]
+        important_prefixes = _IMPORTANT_PREFIXES + (
+            _as_prefix(current_dir),
+            _as_prefix(os.path.dirname(current_dir)),
+        )
 
-        if any(target.startswith(important) for important in important_paths):
+        if _as_prefix(target).startswith(important_prefixes):
             print(f"\n⚠️  WARNING: You're about to delete an important path!")
             print(f"   This could cause system instability!")
             confirm = input("Are you ABSOLUTELY sure? (type 'YES' to confirm): ")
@@ -619,9 +929,14 @@ class FileOperationsTool(BaseTool):
         if not os.path.isabs(target):
             target = os.path.join(current_dir, target)
 
-        if not os.path.exists(target):
+        # One stat serves the type, size, time and permission sections
+        try:
+            stat_info = os.stat(target)
+        except OSError:
             print(f"❌ Path not found: {target}")
             return
+        is_file = stat.S_ISREG(stat_info.st_mode)
+        is_dir = stat.S_ISDIR(stat_info.st_mode)
 
         # Get detailed information
         path_obj = Path(target)
@@ -629,47 +944,33 @@ class FileOperationsTool(BaseTool):
         print(f"\n📋 Basic Information:")
         print(f"   Path: {target}")
         print(f"   Name: {path_obj.name}")
-        print(f"   Type: {'File' if path_obj.is_file() else 'Folder'}")
+        print(f"   Type: {'File' if is_file else 'Folder'}")
         print(f"   Absolute path: {path_obj.absolute()}")
 
-        if path_obj.is_file():
+        if is_file:
             print(f"   Extension: {path_obj.suffix}")
             print(f"   Stem (without extension): {path_obj.stem}")
 
-        # Size information
-        size = self._get_path_size(target)
+        # Size information; folders are counted and sized in one walk
+        if is_dir:
+            file_count, folder_count, size = self._tree_totals(target)
+        else:
+            size = self._get_path_size(target, stat_info)
         print(f"\n📏 Size Information:")
-        print(f"   Size: {self._format_size(size)} ({size:,} bytes)")
+        print(f"   Size: {Utils.format_size(size)} ({size:,} bytes)")
 
-        if path_obj.is_dir():
-            try:
-                # Count files and folders
-                file_count = 0
-                folder_count = 0
-                total_size = 0
-
-                for root, dirs, files in os.walk(target):
-                    folder_count += len(dirs)
-                    file_count += len(files)
-                    for file in files:
-                        try:
-                            total_size += os.path.getsize(os.path.join(root, file))
-                        except:
-                            pass
-
-                print(f"   Contains: {file_count} files, {folder_count} folders")
-                print(
-                    f"   Total size (including subfolders): {self._format_size(total_size)}"
-                )
-            except:
-                pass
+        if is_dir:
+            print(f"   Contains: {file_count} files, {folder_count} folders")
+            print(
+                f"   Total size (including subfolders): {Utils.format_size(size)}"
+            )
 
         # Time information
         print(f"\n🕒 Time Information:")
         try:
-            created = time.ctime(os.path.getctime(target))
-            modified = time.ctime(os.path.getmtime(target))
-            accessed = time.ctime(os.path.getatime(target))
+            created = time.ctime(stat_info.st_ctime)
+            modified = time.ctime(stat_info.st_mtime)
+            accessed = time.ctime(stat_info.st_atime)
 
             print(f"   Created: {created}")
             print(f"   Modified: {modified}")
@@ -680,8 +981,6 @@ class FileOperationsTool(BaseTool):
         # Permission information
         print(f"\n🔒 Permission Information:")
         try:
-            stat_info = os.stat(target)
-
             # Unix-like permissions
             if hasattr(stat_info, "st_mode"):
                 mode = stat_info.st_mode
@@ -702,52 +1001,46 @@ class FileOperationsTool(BaseTool):
                 print(f"   Human readable: {''.join(perms)}")
 
             # Owner information (Unix)
-            if hasattr(stat_info, "st_uid"):
-                import pwd
-
-                try:
-                    owner = pwd.getpwuid(stat_info.st_uid).pw_name
+            if pwd is not None:
+                owner = _owner_name(stat_info.st_uid)
+                if owner is not None:
                     print(f"   Owner: {owner} (UID: {stat_info.st_uid})")
-                except:
-                    pass
 
             # Group information (Unix)
-            if hasattr(stat_info, "st_gid"):
-                import grp
-
-                try:
-                    group = grp.getgrgid(stat_info.st_gid).gr_name
+            if grp is not None:
+                group = _group_name(stat_info.st_gid)
+                if group is not None:
                     print(f"   Group: {group} (GID: {stat_info.st_gid})")
-                except:
-                    pass
 
         except:
             print("   Permission information not available")
 
         # For Python files, show additional info
-        if path_obj.is_file() and path_obj.suffix == ".py":
+        if is_file and path_obj.suffix == ".py":
             print(f"\n🐍 Python File Analysis:")
             try:
                 with open(target, "r", encoding="utf-8") as f:
                     content = f.read()
-                    lines = content.split("\n")
-                    code_lines = [
-                        l for l in lines if l.strip() and not l.strip().startswith("#")
-                    ]
-                    comment_lines = [l for l in lines if l.strip().startswith("#")]
-                    blank_lines = [l for l in lines if not l.strip()]
-
-                    print(f"   Total lines: {len(lines)}")
-                    print(f"   Code lines: {len(code_lines)}")
-                    print(f"   Comment lines: {len(comment_lines)}")
-                    print(f"   Blank lines: {len(blank_lines)}")
 
-                    # Check for imports
-                    import re
+                    # Classify each line once instead of filtering three times
+                    total_lines = code_lines = comment_lines = blank_lines = 0
+                    for line in content.split("\n"):
+                        total_lines += 1
+                        stripped = line.strip()
+                        if not stripped:
+                            blank_lines += 1
+                        elif stripped[0] == "#":
+                            comment_lines += 1
+                        else:
+                            code_lines += 1
+
+                    print(f"   Total lines: {total_lines}")
+                    print(f"   Code lines: {code_lines}")
+                    print(f"   Comment lines: {comment_lines}")
+                    print(f"   Blank lines: {blank_lines}")
 
-                    imports = re.findall(
-                        r"^\s*(import|from)\s+(\w+)", content, re.MULTILINE
-                    )
+                    # Check for imports
+                    imports = _IMPORT_RE.findall(content)
                     if imports:
                         print(f"   Imports: {len(imports)} found")
                         # Show unique imports
@@ -907,13 +1200,14 @@ class FileOperationsTool(BaseTool):
 
         # Create file
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
+            with open(file_path, "w", encoding="utf-8", buffering=1 << 20) as f:
                 f.write(content)
 
             file_size = os.path.getsize(file_path)
             print(f"✅ File created: {file_path}")
-            print(f"📍 Full path: {os.path.abspath(file_path)}")
-            print(f"📏 Size: {self._format_size(file_size)}")
+            # file_path is already absolute; normpath only folds any "..", no getcwd
+            print(f"📍 Full path: {os.path.normpath(file_path)}")
+            print(f"📏 Size: {Utils.format_size(file_size)}")
 
         except Exception as e:
             print(f"❌ Failed to create file: {e}")
@@ -929,11 +1223,13 @@ class FileOperationsTool(BaseTool):
             Template content.
         """
         name_without_ext = os.path.splitext(filename)[0]
+        ts = self._get_current_timestamp()
 
+        # Only the selected template is rendered
         templates = {
-            ".py": f'''"""                        
+            ".py": lambda: f'''"""                        
             {filename}
-            Created on {self._get_current_timestamp()}
+            Created on {ts}
             """
 
             def main():
@@ -943,10 +1239,10 @@ class FileOperationsTool(BaseTool):
             if name == "main":
             main()
             ''',
-            ".html": f"""<!DOCTYPE html>
+            ".html": lambda: f"""<!DOCTYPE html>
 
-            <html lang="en"> <head> <meta charset="UTF-8"> <meta name="viewport" content="width=device-width, initial-scale=1.0"> <title>{name_without_ext}</title> <style> body {{ font-family: Arial, sans-serif; line-height: 1.6; margin: 0; padding: 20px; background-color: #f4f4f4; }} .container {{ max-width: 800px; margin: 0 auto; background: white; padding: 20px; border-radius: 5px; box-shadow: 0 0 10px rgba(0,0,0,0.1); }} </style> </head> <body> <div class="container"> <h1>{name_without_ext}</h1> <p>Created on {self._get_current_timestamp()}</p> </div> </body> </html> """,
-            ".js": f"""// {filename} // Created on {self._get_current_timestamp()}
+            <html lang="en"> <head> <meta charset="UTF-8"> <meta name="viewport" content="width=device-width, initial-scale=1.0"> <title>{name_without_ext}</title> <style> body {{ font-family: Arial, sans-serif; line-height: 1.6; margin: 0; padding: 20px; background-color: #f4f4f4; }} .container {{ max-width: 800px; margin: 0 auto; background: white; padding: 20px; border-radius: 5px; box-shadow: 0 0 10px rgba(0,0,0,0.1); }} </style> </head> <body> <div class="container"> <h1>{name_without_ext}</h1> <p>Created on {ts}</p> </div> </body> </html> """,
+            ".js": lambda: f"""// {filename} // Created on {ts}
             console.log("{name_without_ext} loaded");
 
             function main() {{
@@ -956,14 +1252,14 @@ class FileOperationsTool(BaseTool):
             // Call main function
             main();
             """,
-            ".txt": f"""{filename}
-            Created on {self._get_current_timestamp()}
+            ".txt": lambda: f"""{filename}
+            Created on {ts}
 
             This is a text file.
             """,
-            ".md": f"""# {name_without_ext}
+            ".md": lambda: f"""# {name_without_ext}
 
-            Created on {self._get_current_timestamp()}
+            Created on {ts}
 
             Description
             This is a Markdown file.
@@ -971,16 +1267,16 @@ class FileOperationsTool(BaseTool):
             Usage
             Edit this file to add your content.
             """,
-            ".json": '''{
+            ".json": lambda: '''{
             "name": "file",
             "version": "1.0.0",
             "description": "JSON file",
             "created": "'''
-            + self._get_current_timestamp()
+            + ts
             + """"
             }""",
-            ".css": f"""/* {filename} */
-            /* Created on {self._get_current_timestamp()} */
+            ".css": lambda: f"""/* {filename} */
+            /* Created on {ts} */
 
             body {{
             font-family: Arial, sans-serif;
@@ -995,8 +1291,8 @@ class FileOperationsTool(BaseTool):
             padding: 20px;
             }}
             """,
-            ".sql": f"""-- {filename}
-            -- Created on {self._get_current_timestamp()}
+            ".sql": lambda: f"""-- {filename}
+            -- Created on {ts}
 
             -- Create tables
             CREATE TABLE IF NOT EXISTS example (
@@ -1012,56 +1308,114 @@ class FileOperationsTool(BaseTool):
             SELECT * FROM example;
             """,
         }
-        return templates.get(extension, "")
+        build = templates.get(extension)
+        return build() if build else ""
 
     @staticmethod
-    def _get_path_size(path: str) -> int:
-        """Get size of file or folder in bytes.
+    def _next_free_name(dest: str) -> str:
+        """Pick a free "<base>_<n><ext>" name next to an existing destination.
+
+        The parent folder is listed once and n is one past the highest suffix
+        already taken, instead of probing _1, _2, ... with a stat each.
 
         Args:
-            path: Path to file or folder.
+            dest: Destination path that already exists.
 
         Returns:
-            Size in bytes.
+            Unused destination path.
+        """
+        base, ext = os.path.splitext(dest)
+        prefix = os.path.basename(base) + "_"
+        start, end = len(prefix), -len(ext) if ext else None
+
+        highest = 0
+        try:
+            with os.scandir(os.path.dirname(dest) or ".") as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith(prefix) and name.endswith(ext):
+                        suffix = name[start:end]
+                        if suffix.isdecimal():
+                            highest = max(highest, int(suffix))
+        except OSError:
+            pass
+        return f"{base}_{highest + 1}{ext}"
+
+    @staticmethod
+    def _tree_totals(path: str) -> Tuple[int, int, int]:
+        """Count files and folders under a directory and sum file sizes.
+
+        On POSIX the sizes come from stat calls relative to each open
+        directory fd, so the kernel resolves one name per file rather than
+        the full path.
+
+        Args:
+            path: Directory to measure.
+
+        Returns:
+            (file count, folder count, total size in bytes)
         """
-        if os.path.isfile(path):
+        file_count = 0
+        folder_count = 0
+        total_size = 0
+
+        if _HAS_FWALK:
+            for _, dirs, files, dir_fd in os.fwalk(path):
+                folder_count += len(dirs)
+                file_count += len(files)
+                for name in files:
+                    try:
+                        total_size += os.stat(name, dir_fd=dir_fd).st_size
+                    except OSError:
+                        continue
+            return file_count, folder_count, total_size
+
+        # Elsewhere DirEntry types come from the listing itself (and sizes too
+        # on Windows), so only symlinks and sizes cost extra stat calls
+        pending = [path]
+        while pending:
             try:
-                return os.path.getsize(path)
-            except:
-                return 0
-        elif os.path.isdir(path):
-            total_size = 0
-            for dirpath, dirnames, filenames in os.walk(path):
-                for filename in filenames:
-                    filepath = os.path.join(dirpath, filename)
+                entries = os.scandir(pending.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
                     try:
-                        total_size += os.path.getsize(filepath)
-                    except:
+                        if entry.is_dir():
+                            # Like os.walk: symlinked folders count but aren't followed
+                            folder_count += 1
+                            if not entry.is_symlink():
+                                pending.append(entry.path)
+                        else:
+                            file_count += 1
+                            total_size += entry.stat().st_size
+                    except OSError:
                         continue
-            return total_size
-        return 0
+        return file_count, folder_count, total_size
 
     @staticmethod
-    def _format_size(size_bytes: int) -> str:
-        """Format size in human readable format.
+    def _get_path_size(path: str, st: Optional[os.stat_result] = None) -> int:
+        """Get size of file or folder in bytes.
 
         Args:
-            size_bytes: Size in bytes.
+            path: Path to file or folder.
+            st: Result of os.stat(path) if the caller already has it.
 
         Returns:
-            Formatted size string.
+            Size in bytes.
         """
-        if size_bytes == 0:
-            return "0 B"
-
-        units = ["B", "KB", "MB", "GB", "TB"]
-        unit_index = 0
-
-        while size_bytes >= 1024 and unit_index < len(units) - 1:
-            size_bytes /= 1024.0
-            unit_index += 1
+        if st is None:
+            try:
+                st = os.stat(path)
+            except OSError:
+                return 0
 
-        return f"{size_bytes:.2f} {units[unit_index]}"
+        if stat.S_ISREG(st.st_mode):
+            return st.st_size
+        elif stat.S_ISDIR(st.st_mode):
+            # Shares the fd-relative stat walk used by file info
+            return FileOperationsTool._tree_totals(path)[2]
+        return 0
 
     @staticmethod
     def _get_current_timestamp() -> str:
@@ -1070,8 +1424,6 @@ class FileOperationsTool(BaseTool):
         Returns:
             Formatted timestamp.
         """
-        from datetime import datetime
-
         return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     @staticmethod
@@ -1085,38 +1437,10 @@ class FileOperationsTool(BaseTool):
             True if successful, False otherwise.
         """
         try:
-            import pyperclip
-
-            pyperclip.copy(text)
+            if pyperclip is not None:
+                pyperclip.copy(text)
+            else:
+                subprocess.run(_CLIPBOARD_CMD, input=text.encode("utf-8"), check=True)
             return True
-        except ImportError:
-            # Try platform-specific methods
-            try:
-                if os.name == "nt":  # Windows
-                    import subprocess
-
-                    subprocess.run(["clip"], input=text.encode("utf-8"), check=True)
-                    return True
-                elif os.name == "posix":  # Linux/Unix
-                    import subprocess
-
-                    if "WAYLAND_DISPLAY" in os.environ:
-                        subprocess.run(
-                            ["wl-copy"], input=text.encode("utf-8"), check=True
-                        )
-                    else:
-                        subprocess.run(
-                            ["xclip", "-selection", "clipboard"],
-                            input=text.encode("utf-8"),
-                            check=True,
-                        )
-                    return True
-                elif os.name == "darwin":  # macOS
-                    import subprocess
-
-                    subprocess.run(["pbcopy"], input=text.encode("utf-8"), check=True)
-                    return True
-            except:
-                return False
-        except:
+        except Exception:
             return False
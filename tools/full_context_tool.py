@@ -1,11 +1,29 @@
 """Tool to generate optimized project context for AI assistance."""
 
+import fnmatch
 import os
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Set, Optional
+from typing import Iterator, List, Set, Optional, Tuple
+from tools._registry import register_tool
 from tools.base_tool import BaseTool
 from util.utils import Utils
 
+# Reads release the GIL, so a few threads overlap disk latency
+_READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Files read ahead of the consumer; bounds wasted reads past the size limit
+_READ_AHEAD = _READ_WORKERS * 2
+
+# Section separator used throughout the generated context
+_SEP = "=" * 60
+
+# Flags for writing a saved context; O_BINARY keeps Windows from translating bytes
+_SAVE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+@register_tool
 class FullContextTool(BaseTool):
     """Create optimized project context for AI assistance with flexible filtering."""
 
@@ -43,7 +61,7 @@ class FullContextTool(BaseTool):
     }
 
     # Prioritized extensions for AI understanding
-    PRIORITY_EXTENSIONS = {
+    PRIORITY_EXTENSIONS = frozenset({
         ".py", ".js", ".jsx", ".ts", ".tsx",  # Code
         ".html", ".htm", ".css", ".scss", ".sass",  # Web
         ".json", ".yaml", ".yml", ".toml",  # Config
@@ -52,7 +70,35 @@ class FullContextTool(BaseTool):
         ".java", ".cpp", ".c", ".h", ".hpp",  # Other languages
         ".go", ".rs", ".rb", ".php",
         ".cs", ".swift", ".kt", ".dart",
-    }
+    })
+    
+    # Known binary formats skipped by "all" mode without opening them
+    BINARY_EXTENSIONS = frozenset({
+        ".png", ".jpg", ".jpeg", ".gif", ".bmp", ".ico", ".webp", ".tif", ".tiff",  # Images
+        ".mp3", ".wav", ".ogg", ".flac", ".mp4", ".mov", ".avi", ".mkv", ".webm",  # Media
+        ".zip", ".tar", ".gz", ".tgz", ".bz2", ".xz", ".7z", ".rar",  # Archives
+        ".pdf", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx",  # Documents
+        ".exe", ".bin", ".o", ".a", ".lib", ".class", ".jar", ".whl", ".egg",  # Binaries
+        ".ttf", ".otf", ".woff", ".woff2", ".eot",  # Fonts
+        ".sqlite", ".sqlite3", ".pkl", ".pickle", ".npy", ".npz",  # Data
+    })
+    
+    # Key files picked by smart selection
+    IMPORTANT_PATTERNS = (
+        "README*", "readme*",
+        "requirements*.txt", "pyproject.toml", "package.json",
+        "setup.py", "setup.cfg",
+        "*.py", "*.js", "*.ts", "*.jsx", "*.tsx",
+        "*.html", "*.css",
+        "*.json", "*.yaml", "*.yml",
+    )
+    
+    # Notices appended when the total size limit stops collection
+    _OMITTED_NOTICE = "\n[⚠️  Total size limit reached. Some files omitted.]\n"
+    _LIMIT_NOTICE = "\n[⚠️  Total size limit reached.]\n"
+    
+    # All important patterns as one regex, compiled once
+    _IMPORTANT_RE = re.compile("|".join(fnmatch.translate(p) for p in IMPORTANT_PATTERNS))
 
     def run(self) -> None:
         """Execute the context generation process with user options."""
@@ -84,11 +130,14 @@ class FullContextTool(BaseTool):
         # Prepare final output
         final_output = self._format_output(project_name, tree_structure, file_contents, config)
         
+        # Encoded once; the preview reports its size and a full save writes it
+        output_bytes = self._encode_text(final_output)
+        
         # Preview
-        self._show_preview(final_output)
+        self._show_preview(final_output, len(output_bytes))
         
         # Save options
-        self._handle_save_options(project_name, final_output)
+        self._handle_save_options(project_name, final_output, output_bytes)
         
         input("\nPress Enter to continue...")
     
@@ -128,9 +177,16 @@ class FullContextTool(BaseTool):
         mode_map = {'1': 'smart', '2': 'all', '3': 'custom'}
         selection_mode = mode_map.get(mode_choice, 'smart')
         
+        # "*suffix" patterns match by ending, anything else by exact name;
+        # split once so each file costs a set lookup and one endswith call
+        ignore_exact = frozenset(p for p in ignore_files if not p.startswith('*'))
+        ignore_suffix = tuple(p[1:] for p in ignore_files if p.startswith('*'))
+        
         config.update({
             'ignore_dirs': ignore_dirs,
             'ignore_files': ignore_files,
+            'ignore_exact': ignore_exact,
+            'ignore_suffix': ignore_suffix,
             'selection_mode': selection_mode,
             'max_file_size': 10000,
             'max_total_size': 50000
@@ -140,115 +196,74 @@ class FullContextTool(BaseTool):
     
     def _generate_tree(self, start_path: str, ignore_dirs: Set[str]) -> str:
         """Generate tree structure with ignore support."""
-        def _tree_recursive(path: Path, prefix: str = "", depth: int = 0, max_depth: int = 5) -> str:
+        chunks = ["Project Tree:\n"]
+        append = chunks.append
+        normcase = os.path.normcase
+        
+        def _tree_recursive(path: str, prefix: str = "", depth: int = 0, max_depth: int = 5) -> None:
             if depth > max_depth:
-                return prefix + "└── [depth limit reached]\n"
+                append(prefix + "└── [depth limit reached]\n")
+                return
             
+            # DirEntry caches the type from the listing, so is_dir() needs no stat.
+            # normcase keeps Path ordering: case-insensitive on Windows.
             try:
-                items = sorted(path.iterdir())
-            except (PermissionError, OSError):
-                return ""
+                with os.scandir(path) as it:
+                    items = sorted(it, key=lambda entry: normcase(entry.name))
+            except OSError:
+                return
             
             # Filter items
             dirs = []
             files = []
             for item in items:
-                if item.name.startswith('.'):
+                name = item.name
+                if name[:1] == '.':
                     continue
                     
                 if item.is_dir():
-                    if item.name not in ignore_dirs:
-                        dirs.append(item)
+                    if name not in ignore_dirs:
+                        dirs.append((name, item.path))
                 else:
-                    files.append(item)
+                    files.append((name, None))
             
+            # Folders come first, so an index below dir_count is a folder
             all_items = dirs + files
-            tree_str = ""
+            dir_count = len(dirs)
+            last_idx = len(all_items) - 1
             
-            for idx, item in enumerate(all_items):
-                is_last = idx == len(all_items) - 1
+            for idx, (name, item_path) in enumerate(all_items):
+                is_last = idx == last_idx
                 connector = "└── " if is_last else "├── "
-                icon = "📁 " if item.is_dir() else "📄 "
-                tree_str += f"{prefix}{connector}{icon}{item.name}\n"
-                
-                if item.is_dir():
+                if idx < dir_count:
+                    append(f"{prefix}{connector}📁 {name}\n")
                     extension = "    " if is_last else "│   "
-                    tree_str += _tree_recursive(item, prefix + extension, depth + 1, max_depth)
-            
-            return tree_str
+                    _tree_recursive(item_path, prefix + extension, depth + 1, max_depth)
+                else:
+                    append(f"{prefix}{connector}📄 {name}\n")
         
-        return f"Project Tree:\n{_tree_recursive(Path(start_path))}"
+        _tree_recursive(start_path)
+        return "".join(chunks)
     
-    def _get_smart_files_content(self, project_path: str, config: dict) -> str:
+    def _get_smart_files_content(self, project_path: str, config: dict) -> List[str]:
         """Get contents of important files for AI understanding."""
-        important_patterns = [
-            "README*", "readme*",
-            "requirements*.txt", "pyproject.toml", "package.json",
-            "setup.py", "setup.cfg",
-            "*.py", "*.js", "*.ts", "*.jsx", "*.tsx",
-            "*.html", "*.css",
-            "*.json", "*.yaml", "*.yml",
-        ]
-        
-        content_str = ""
-        total_size = 0
-        
-        for root, dirs, files in os.walk(project_path):
-            # Skip ignored directories
-            dirs[:] = [d for d in dirs if d not in config['ignore_dirs']]
-            
-            for file in files:
-                # Check ignore patterns
-                if self._should_ignore_file(file, config['ignore_files']):
-                    continue
-                
-                # Check if file is important
-                if not self._is_important_file(file, important_patterns):
-                    continue
-                
-                path = os.path.join(root, file)
-                content = self._read_file_safe(path, config['max_file_size'])
-                
-                if content:
-                    rel_path = os.path.relpath(path, project_path)
-                    total_size += len(content)
-                    
-                    if total_size > config['max_total_size']:
-                        content_str += f"\n[⚠️  Total size limit reached. Some files omitted.]\n"
-                        break
-                    
-                    content_str += self._format_file_content(rel_path, content)
-        
-        return content_str
+        files = (
+            (path, rel_path)
+            for path, rel_path, file in self._iter_files(project_path, "", config)
+            if self._is_important_file(file)
+        )
+        return self._collect_content(files, config, self._OMITTED_NOTICE)
     
-    def _get_all_files_content(self, project_path: str, config: dict) -> str:
+    def _get_all_files_content(self, project_path: str, config: dict) -> List[str]:
         """Get contents of all allowed files."""
-        content_str = ""
-        total_size = 0
-        
-        for root, dirs, files in os.walk(project_path):
-            dirs[:] = [d for d in dirs if d not in config['ignore_dirs']]
-            
-            for file in files:
-                if self._should_ignore_file(file, config['ignore_files']):
-                    continue
-                
-                path = os.path.join(root, file)
-                content = self._read_file_safe(path, config['max_file_size'])
-                
-                if content:
-                    rel_path = os.path.relpath(path, project_path)
-                    total_size += len(content)
-                    
-                    if total_size > config['max_total_size']:
-                        content_str += f"\n[⚠️  Total size limit reached. Some files omitted.]\n"
-                        break
-                    
-                    content_str += self._format_file_content(rel_path, content)
-        
-        return content_str
+        files = (
+            (path, rel_path)
+            for path, rel_path, file in self._iter_files(project_path, "", config)
+            if not self._is_binary_file(file)
+        )
+        return self._collect_content(files, config, self._OMITTED_NOTICE)
     
-    def _get_custom_files_content(self, project_path: str, config: dict) -> str:
+    def _get_custom_files_content(self, project_path: str, config: dict) -> List[str]:
         """Get contents of user-selected files/folders."""
         print("\n🎯 Custom File Selection:")
         print("-" * 40)
@@ -279,73 +294,172 @@ class FullContextTool(BaseTool):
             print("No files selected. Using smart selection instead.")
             return self._get_smart_files_content(project_path, config)
         
-        # Process selected paths
-        content_str = ""
+        # Process selected paths as one flat stream, so hitting the limit ends
+        # the whole collection instead of only the current folder's walk
+        files = self._iter_selected(project_path, selected_paths, config)
+        return self._collect_content(files, config, self._LIMIT_NOTICE)
+    
+    def _collect_content(
+        self, files: Iterator[Tuple[str, str]], config: dict, limit_notice: str
+    ) -> List[str]:
+        """Read and format files until the total size limit is reached.
+
+        Shared by every selection mode, which differ only in the files they pass.
+
+        Args:
+            files: (full path, relative path) pairs in output order.
+            config: User configuration with the size limits.
+            limit_notice: Line appended when the total size limit stops reading.
+
+        Returns:
+            Formatted file chunks.
+        """
+        chunks = []
         total_size = 0
         
+        for rel_path, content in self._read_files(files, config['max_file_size']):
+            if content:
+                total_size += len(content)
+                
+                if total_size > config['max_total_size']:
+                    chunks.append(limit_notice)
+                    break
+                
+                chunks.append(self._format_file_content(rel_path, content))
+        
+        return chunks
+    
+    def _iter_selected(
+        self, project_path: str, selected_paths: List[str], config: dict
+    ) -> Iterator[Tuple[str, str]]:
+        """Expand user-selected files and folders into the files to read.
+
+        Args:
+            project_path: Project root the relative paths are based on.
+            selected_paths: Absolute paths chosen by the user.
+            config: User configuration with the ignore lists.
+
+        Yields:
+            (full path, path relative to the project) per file.
+        """
         for selected_path in selected_paths:
             if os.path.isfile(selected_path):
-                content = self._read_file_safe(selected_path, config['max_file_size'])
-                if content:
-                    rel_path = os.path.relpath(selected_path, project_path)
-                    total_size += len(content)
-                    
-                    if total_size > config['max_total_size']:
-                        content_str += f"\n[⚠️  Total size limit reached.]\n"
-                        break
-                    
-                    content_str += self._format_file_content(rel_path, content)
-            
+                yield selected_path, os.path.relpath(selected_path, project_path)
             elif os.path.isdir(selected_path):
-                for root, dirs, files in os.walk(selected_path):
-                    dirs[:] = [d for d in dirs if d not in config['ignore_dirs']]
-                    
-                    for file in files:
-                        if self._should_ignore_file(file, config['ignore_files']):
-                            continue
-                        
-                        path = os.path.join(root, file)
-                        content = self._read_file_safe(path, config['max_file_size'])
-                        
-                        if content:
-                            rel_path = os.path.relpath(path, project_path)
-                            total_size += len(content)
-                            
-                            if total_size > config['max_total_size']:
-                                content_str += f"\n[⚠️  Total size limit reached.]\n"
-                                break
-                            
-                            content_str += self._format_file_content(rel_path, content)
-        
-        return content_str
+                rel_root = os.path.join(os.path.relpath(selected_path, project_path), "")
+                for path, rel_path, _ in self._iter_files(selected_path, rel_root, config):
+                    yield path, rel_path
+    
+    def _iter_files(self, root: str, rel_prefix: str, config: dict) -> Iterator[Tuple[str, str, str]]:
+        """Walk a tree with os.scandir in os.walk's top-down order.
+
+        Entry types come from the directory listing and relative paths are
+        built from each folder's prefix, so no per-file stat, join or relpath.
+
+        Args:
+            root: Directory to walk.
+            rel_prefix: Path of root relative to the project, "" or ending in os.sep.
+            config: User configuration with the ignore lists.
+
+        Yields:
+            (full path, path relative to the project, file name) per file.
+        """
+        try:
+            entries = os.scandir(root)
+        except OSError:
+            return
+
+        ignore_dirs = config['ignore_dirs']
+        subdirs = []
+        with entries:
+            for entry in entries:
+                name = entry.name
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+
+                if is_dir:
+                    # Like os.walk: symlinked folders are neither files nor followed
+                    if name not in ignore_dirs and not entry.is_symlink():
+                        subdirs.append((entry.path, rel_prefix + name + os.sep))
+                elif not self._should_ignore_file(name, config):
+                    yield entry.path, rel_prefix + name, name
+
+        for dir_path, dir_rel in subdirs:
+            yield from self._iter_files(dir_path, dir_rel, config)
     
-    def _should_ignore_file(self, filename: str, ignore_patterns: Set[str]) -> bool:
-        """Check if file should be ignored based on patterns."""
-        for pattern in ignore_patterns:
-            if pattern.startswith('*'):
-                if filename.endswith(pattern[1:]):
-                    return True
-            elif filename == pattern:
-                return True
-        return False
+    def _should_ignore_file(self, filename: str, config: dict) -> bool:
+        """Check if file should be ignored based on the precompiled patterns."""
+        return filename in config['ignore_exact'] or filename.endswith(config['ignore_suffix'])
     
-    def _is_important_file(self, filename: str, patterns: List[str]) -> bool:
+    def _is_important_file(self, filename: str) -> bool:
         """Check if file is important based on patterns."""
-        import fnmatch
-        
-        for pattern in patterns:
-            if fnmatch.fnmatch(filename, pattern):
-                return True
+        if self._IMPORTANT_RE.match(filename):
+            return True
         
         # Check by extension
-        ext = os.path.splitext(filename)[1].lower()
-        return ext in self.PRIORITY_EXTENSIONS
+        return self._has_extension(filename, self.PRIORITY_EXTENSIONS)
+    
+    def _is_binary_file(self, filename: str) -> bool:
+        """Check by extension alone whether a file is a known binary format."""
+        return self._has_extension(filename, self.BINARY_EXTENSIONS)
+    
+    @staticmethod
+    def _has_extension(filename: str, extensions: frozenset) -> bool:
+        """Check a file's extension against a set of lowercase extensions.
+
+        Slices the extension without splitext's tuple and only lowercases it
+        when the name isn't already a lowercase match.
+
+        Args:
+            filename: File name.
+            extensions: Lowercase extensions including the dot.
+
+        Returns:
+            True if the extension is in the set, ignoring case.
+        """
+        dot = filename.rfind('.')
+        if dot <= 0:
+            return False
+        ext = filename[dot:]
+        return ext in extensions or ext.lower() in extensions
+    
+    def _read_files(
+        self, files: Iterator[Tuple[str, str]], max_size: int
+    ) -> Iterator[Tuple[str, Optional[str]]]:
+        """Read files on a thread pool, yielding results in walk order.
+
+        At most _READ_AHEAD reads run ahead of the consumer. When the consumer
+        stops early, the files not yet started are cancelled.
+
+        Args:
+            files: (full path, relative path) pairs.
+            max_size: Per-file character limit.
+
+        Yields:
+            (relative path, content) per file.
+        """
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=_READ_WORKERS) as executor:
+            try:
+                for path, rel_path in files:
+                    pending.append((rel_path, executor.submit(self._read_file_safe, path, max_size)))
+                    if len(pending) >= _READ_AHEAD:
+                        rel, future = pending.popleft()
+                        yield rel, future.result()
+                while pending:
+                    rel, future = pending.popleft()
+                    yield rel, future.result()
+            finally:
+                for _, future in pending:
+                    future.cancel()
     
     def _read_file_safe(self, filepath: str, max_size: int) -> Optional[str]:
         """Safely read file with size limit."""
         try:
             with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read(max_size * 2)  # Read slightly more for truncation check
+                content = f.read(max_size + 1)  # One extra char tells whether to truncate
                 
                 if len(content) > max_size:
                     content = content[:max_size] + "\n\n...[File truncated due to size]..."
@@ -356,26 +470,30 @@ class FullContextTool(BaseTool):
     
     def _format_file_content(self, rel_path: str, content: str) -> str:
         """Format file content for output."""
-        separator = "=" * 60
-        return f"\n{separator}\n📄 FILE: {rel_path}\n{separator}\n{content}\n"
+        return f"\n{_SEP}\n📄 FILE: {rel_path}\n{_SEP}\n{content}\n"
     
-    def _format_output(self, project_name: str, tree: str, contents: str, config: dict) -> str:
-        """Format the final output."""
-        output = f"""🤖 PROJECT CONTEXT FOR AI ASSISTANCE
-{'=' * 60}
+    def _format_output(self, project_name: str, tree: str, contents: List[str], config: dict) -> str:
+        """Format the final output.
+
+        File chunks are joined straight into the result, so the collected
+        contents are copied once rather than first into their own string.
+        """
+        head = f"""🤖 PROJECT CONTEXT FOR AI ASSISTANCE
+{_SEP}
 PROJECT: {project_name}
 SELECTION MODE: {config['selection_mode'].upper()}
 GENERATED: {Utils.get_timestamp()}
-{'=' * 60}
+{_SEP}
 
 📁 PROJECT STRUCTURE:
 {tree}
 
-{'=' * 60}
+{_SEP}
 📝 FILE CONTENTS:
-{contents}
+"""
+        tail = f"""
 
-{'=' * 60}
+{_SEP}
 💡 FOR AI ASSISTANT:
 This is the complete context of the project. Please analyze the structure
 and code to provide accurate assistance. Key files include configuration
@@ -383,9 +501,9 @@ files, source code, and documentation.
 
 When responding, reference specific files and paths from the structure above.
 """
-        return output
+        return "".join([head, *contents, tail])
     
-    def _show_preview(self, output: str) -> None:
+    def _show_preview(self, output: str, size: int) -> None:
         """Show preview of generated context."""
         print("\n📋 PREVIEW:")
         print("-" * 60)
@@ -399,7 +517,7 @@ When responding, reference specific files and paths from the structure above.
         
         print(f"\n📊 Statistics:")
         print(f"  • Total lines: {len(lines)}")
-        print(f"  • Approx. size: {len(output.encode('utf-8')):,} bytes")
+        print(f"  • Approx. size: {size:,} bytes")
     
     def _show_quick_tree(self, path: str, depth: int = 2) -> None:
         """Show quick tree view."""
@@ -423,7 +541,7 @@ When responding, reference specific files and paths from the structure above.
         
         _quick_tree(Path(path), 0, depth)
     
-    def _handle_save_options(self, project_name: str, content: str) -> None:
+    def _handle_save_options(self, project_name: str, content: str, content_bytes: bytes) -> None:
         """Handle file saving options."""
         print("\n💾 Save Options:")
         print("  [1] Save full context")
@@ -452,7 +570,7 @@ When responding, reference specific files and paths from the structure above.
                 # Extract structure section
                 lines = content.split('\n')
                 start = next(i for i, line in enumerate(lines) if "PROJECT STRUCTURE:" in line)
-                end = next(i for i, line in enumerate(lines[start+1:]) if "="*60 in line)
+                end = next(i for i, line in enumerate(lines[start+1:]) if _SEP in line)
                 save_content = '\n'.join(lines[start:start+end+1])
             else:
                 # Extract contents section
@@ -463,21 +581,54 @@ When responding, reference specific files and paths from the structure above.
             save_content = self._create_ai_prompt_template(content, project_name)
         
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(save_content)
+            data = content_bytes if save_content is content else self._encode_text(save_content)
+            self._write_bytes(filename, data)
             
             print(f"✅ Saved to: {os.path.abspath(filename)}")
-            print(f"📏 Size: {os.path.getsize(filename):,} bytes")
+            print(f"📏 Size: {len(data):,} bytes")
             
             # Show AI prompt suggestion
             if choice == '3':
                 print("\n🤖 AI Prompt Suggestion:")
-                print("=" * 60)
+                print(_SEP)
                 print(save_content[:500] + "...\n[Full prompt in file]")
                 
         except Exception as e:
             print(f"❌ Error saving file: {e}")
     
+    @staticmethod
+    def _encode_text(text: str) -> bytes:
+        """Encode text as it is saved: UTF-8 with os.linesep newlines like text mode.
+
+        Args:
+            text: Text to encode.
+
+        Returns:
+            Encoded bytes.
+        """
+        if os.linesep != "\n":
+            text = text.replace("\n", os.linesep)
+        return text.encode('utf-8')
+    
+    @staticmethod
+    def _write_bytes(filename: str, data: bytes) -> None:
+        """Write bytes straight to the file descriptor.
+
+        Skips the text and buffered layers, so a large context goes out in as
+        few write syscalls as the OS allows.
+
+        Args:
+            filename: Destination path.
+            data: Content to write.
+        """
+        view = memoryview(data)
+        fd = os.open(filename, _SAVE_FLAGS, 0o666)
+        try:
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+    
     def _create_ai_prompt_template(self, context: str, project_name: str) -> str:
         """Create an AI prompt template with the context."""
         return f"""You are an expert developer assistant. Below is the complete context of a project. Please analyze it thoroughly and provide accurate assistance.
@@ -4,10 +4,12 @@ import os
 import subprocess
 import sys
 from typing import Tuple, List, Optional
+from tools._registry import register_tool
 from tools.base_tool import BaseTool
 from util.utils import Utils
 
 
+@register_tool
 class GitRequirementsTool(BaseTool):
     """Manage .gitignore, requirements.txt, and Git operations."""
 
@@ -62,7 +64,7 @@ class GitRequirementsTool(BaseTool):
         if os.path.exists(gitignore_path):
             print("📄 .gitignore file exists.")
             print(f"📍 Location: {gitignore_path}")
-            print(f"📏 Size: {self._format_size(os.path.getsize(gitignore_path))}")
+            print(f"📏 Size: {Utils.format_size(os.path.getsize(gitignore_path), 1)}")
 
             with open(gitignore_path, "r", encoding="utf-8") as f:
                 current_content = f.read()
@@ -146,7 +148,7 @@ class GitRequirementsTool(BaseTool):
 
             print(f"✅ .gitignore created at: {gitignore_path}")
             print(
-                f"📏 File size: {self._format_size(os.path.getsize(gitignore_path))} bytes"
+                f"📏 File size: {Utils.format_size(os.path.getsize(gitignore_path), 1)} bytes"
             )
 
             # Show preview
@@ -292,7 +294,7 @@ class GitRequirementsTool(BaseTool):
 
             print(f"\n⚠️  requirements.txt already exists.")
             print(
-                f"   Current size: {self._format_size(os.path.getsize(requirements_path))}"
+                f"   Current size: {Utils.format_size(os.path.getsize(requirements_path), 1)}"
             )
             print(f"   Current lines: {len(existing_content.splitlines())}")
 
@@ -364,7 +366,7 @@ class GitRequirementsTool(BaseTool):
             stats = content.strip().split("\n")
             print(f"\n✅ requirements.txt generated successfully!")
             print(f"📍 File: {requirements_path}")
-            print(f"📏 Size: {self._format_size(os.path.getsize(requirements_path))}")
+            print(f"📏 Size: {Utils.format_size(os.path.getsize(requirements_path), 1)}")
             print(f"📊 Packages: {len(stats)}")
             print(f"📝 Mode: {mode}")
 
@@ -399,7 +401,7 @@ class GitRequirementsTool(BaseTool):
                 print("\n📄 Found requirements files:")
                 for i, file in enumerate(req_files, 1):
                     size = os.path.getsize(os.path.join(current_dir, file))
-                    print(f"   {i}. {file} ({self._format_size(size)})")
+                    print(f"   {i}. {file} ({Utils.format_size(size, 1)})")
 
                 choice = input(f"\nSelect file (1-{len(req_files)}): ").strip()
                 if choice.isdigit():
@@ -416,7 +418,7 @@ class GitRequirementsTool(BaseTool):
                 return
 
         print(f"📄 File: {requirements_path}")
-        print(f"📏 Size: {self._format_size(os.path.getsize(requirements_path))}")
+        print(f"📏 Size: {Utils.format_size(os.path.getsize(requirements_path), 1)}")
 
         # Count packages
         with open(requirements_path, "r", encoding="utf-8") as f:
@@ -535,7 +537,7 @@ class GitRequirementsTool(BaseTool):
             content = f.read()
 
         print(f"📍 File: {gitignore_path}")
-        print(f"📏 Size: {self._format_size(os.path.getsize(gitignore_path))}")
+        print(f"📏 Size: {Utils.format_size(os.path.getsize(gitignore_path), 1)}")
         print(f"📊 Lines: {len(content.splitlines())}")
 
         # Analyze patterns
@@ -1297,22 +1299,6 @@ class GitRequirementsTool(BaseTool):
 
         return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-    @staticmethod
-    def _format_size(size_bytes: int) -> str:
-        """Format size in human readable format.
-
-        Args:
-            size_bytes: Size in bytes.
-
-        Returns:
-            Formatted size string.
-        """
-        for unit in ["B", "KB", "MB", "GB"]:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.1f} TB"
-
     def _run_command(self, cmd: list, shell: bool = False) -> Tuple[bool, str]:
         """Run a shell command.
 
@@ -1,26 +1,296 @@
 # tools/loader.py
 
-import pkgutil
+import ast
+import json
+import os
 import importlib
+import importlib.machinery
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple, Type
+from tools._registry import REGISTRY
 from tools.base_tool import BaseTool
 import tools
 
+# Discovered tool metadata persisted across runs
+_INDEX_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "dpm",
+    "tools_index.json",
+)
 
-def load_tools():
-    tool_instances = []
+# Upper bound on threads importing tool modules that can't be scanned statically
+_MAX_IMPORT_WORKERS = 8
 
-    for _, module_name, _ in pkgutil.iter_modules(tools.__path__):
-        if module_name in ("base_tool", "loader"):
-            continue
+# One instance per tool class for the whole process, shared by every registry
+_INSTANCES: Dict[Type[BaseTool], BaseTool] = {}
+
+# Suffixes of compiled modules; found on disk but only importable, not scannable
+_EXTENSION_SUFFIXES = tuple(importlib.machinery.EXTENSION_SUFFIXES)
+
+
+def _instance_of(cls: Type[BaseTool]) -> BaseTool:
+    """Get the process-wide instance of a tool class, creating it once.
+
+    Args:
+        cls (Type[BaseTool]): Tool class.
+
+    Returns:
+        BaseTool: Tool instance.
+    """
+    tool = _INSTANCES.get(cls)
+    if tool is None:
+        tool = _INSTANCES[cls] = cls()
+    return tool
+
+
+class LazyToolRegistry:
+    """Tools keyed by display name, imported and instantiated on first access.
+
+    Only static metadata (module, class, name, description) is held until a
+    tool is requested, so startup never imports tools the user doesn't pick.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        # name -> (module_name, class_name, description), in discovery order
+        self._index: Dict[str, Tuple[str, str, str]] = {}
+
+    def add(self, module_name: str, class_name: str, name: str, description: str) -> None:
+        """Register a tool by metadata without importing it.
+
+        Args:
+            module_name (str): Module name inside the tools package.
+            class_name (str): Name of the BaseTool subclass in that module.
+            name (str): Tool name for display.
+            description (str): Tool description for display.
+        """
+        self._index[name] = (module_name, class_name, description)
+
+    def add_class(self, cls: Type[BaseTool]) -> None:
+        """Register a tool class from an already imported module.
+
+        Args:
+            cls (Type[BaseTool]): Tool class.
+        """
+        self._index[cls.name] = (cls.__module__.rpartition(".")[2], cls.__name__, cls.description)
+
+    def names(self) -> List[Tuple[str, str]]:
+        """Get tool metadata without importing anything.
 
+        Returns:
+            List[Tuple[str, str]]: (name, description) per tool, in discovery order.
+        """
+        return [(name, entry[2]) for name, entry in self._index.items()]
+
+    def __getitem__(self, name: str) -> BaseTool:
+        """Get a tool, importing its module and instantiating it on first access.
+
+        Instances live in the process-wide _INSTANCES cache only.
+
+        Args:
+            name (str): Tool name.
+
+        Returns:
+            BaseTool: Tool instance.
+        """
+        module_name, class_name, _ = self._index[name]
         module = importlib.import_module(f"tools.{module_name}")
+        return _instance_of(getattr(module, class_name))
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+def _scan_module(origin: Optional[str]) -> Optional[List[Tuple[str, str, str]]]:
+    """Find @register_tool classes in a tool module without importing it.
+
+    Args:
+        origin (Optional[str]): Path of the module's .py source, or None if
+            it has none (package or compiled extension).
+
+    Returns:
+        Optional[List[Tuple[str, str, str]]]: (class name, name, description)
+        per tool, or None if the module can't be resolved statically and must
+        be imported instead.
+    """
+    if origin is None:
+        return None
+
+    try:
+        with open(origin, "r", encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename=origin)
+    except (OSError, SyntaxError, ValueError):
+        return None
+
+    found = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef) or not node.decorator_list:
+            continue
+        # Only a bare @register_tool is understood; any other decorator
+        # (aliased, dotted, called) might register the class, so import
+        if not all(
+            isinstance(decorator, ast.Name) and decorator.id == "register_tool"
+            for decorator in node.decorator_list
+        ):
+            return None
 
-        for attr in vars(module).values():
+        attrs = {}
+        for stmt in node.body:
             if (
-                isinstance(attr, type)
-                and issubclass(attr, BaseTool)
-                and attr is not BaseTool
+                isinstance(stmt, ast.Assign)
+                and len(stmt.targets) == 1
+                and isinstance(stmt.targets[0], ast.Name)
+                and isinstance(stmt.value, ast.Constant)
+                and isinstance(stmt.value.value, str)
             ):
-                tool_instances.append(attr())
+                attrs[stmt.targets[0].id] = stmt.value.value
+
+        if "name" not in attrs or "description" not in attrs:
+            return None
+        found.append((node.name, attrs["name"], attrs["description"]))
+
+    return found
+
+
+def _scan_package() -> Tuple[list, Dict[str, Optional[str]]]:
+    """List the tools package once for both the index key and its modules.
+
+    The listing already says which files are modules, so no pkgutil walk
+    or per-module find_spec is needed.
+
+    Returns:
+        Tuple[list, Dict[str, Optional[str]]]: JSON-serializable key of every
+        entry's path, mtime and size, and tool module names (sorted) mapped
+        to their .py source or None when they can only be imported.
+    """
+    key = []
+    modules: Dict[str, Optional[str]] = {}
+    for path in tools.__path__:
+        try:
+            entries = list(os.scandir(path))
+        except OSError:
+            continue
+
+        for entry in entries:
+            name = entry.name
+            if name == "__pycache__":
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            key.append([entry.path, st.st_mtime_ns, st.st_size])
+
+            if name.endswith(".py"):
+                module_name, origin = name[:-3], entry.path
+            elif name.endswith(_EXTENSION_SUFFIXES):
+                module_name, origin = name.partition(".")[0], None
+            elif entry.is_dir() and os.path.isfile(os.path.join(entry.path, "__init__.py")):
+                module_name, origin = name, None
+            else:
+                continue
+
+            if (
+                module_name.isidentifier()
+                and module_name not in ("__init__", "base_tool", "loader")
+                and not module_name.startswith("_")
+            ):
+                # Like the import system, the first path entry wins
+                modules.setdefault(module_name, origin)
+
+    key.sort()
+    return key, dict(sorted(modules.items()))
+
+
+@lru_cache(maxsize=1)
+def _tool_index() -> Tuple[Tuple[str, Optional[List[Tuple[str, str, str]]]], ...]:
+    """Scan the tools package, reusing the on-disk index while it is current.
+
+    Returns:
+        Tuple: (module name, _scan_module result) per tool module.
+    """
+    key, modules = _scan_package()
+    try:
+        with open(_INDEX_PATH, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached["key"] == key:
+            return tuple(
+                (module_name, None if found is None else [tuple(item) for item in found])
+                for module_name, found in cached["modules"]
+            )
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    index = tuple((module_name, _scan_module(origin)) for module_name, origin in modules.items())
+
+    # A failed write only costs a rescan next time
+    try:
+        os.makedirs(os.path.dirname(_INDEX_PATH), exist_ok=True)
+        with open(_INDEX_PATH, "w", encoding="utf-8") as f:
+            json.dump({"key": key, "modules": index}, f)
+    except OSError:
+        pass
+    return index
+
+
+def load_tools() -> LazyToolRegistry:
+    """Discover tools in the tools package.
+
+    Returns:
+        LazyToolRegistry: Tools keyed by name; modules are imported on first access.
+    """
+    registry = LazyToolRegistry()
+    index = _tool_index()
+
+    # Modules the static scan couldn't resolve are imported up front, on
+    # threads so their file reads and unmarshalling overlap. Importing runs
+    # each module's @register_tool decorators.
+    to_import = [f"tools.{module_name}" for module_name, found in index if found is None]
+    imported = {}
+    if len(to_import) > 1:
+        with ThreadPoolExecutor(max_workers=min(_MAX_IMPORT_WORKERS, len(to_import))) as executor:
+            imported = dict(zip(to_import, executor.map(importlib.import_module, to_import)))
+    elif to_import:
+        imported[to_import[0]] = importlib.import_module(to_import[0])
+
+    # Register in discovery order so the menu stays stable
+    for module_name, found in index:
+        if found is not None:
+            for class_name, name, description in found:
+                registry.add(module_name, class_name, name, description)
+            continue
+
+        module = imported[f"tools.{module_name}"]
+        for cls in list(REGISTRY.values()):
+            if cls.__module__ == module.__name__:
+                registry.add_class(cls)
+
+    return registry
+
+
+def clear_tool_caches() -> None:
+    """Forget everything load_tools memoizes, e.g. after tools change on disk.
+
+    Drops tool instances, the in-process and on-disk index, and the
+    registered classes along with their modules, so the next load_tools
+    rescans the package and re-imports what it needs.
+    """
+    _INSTANCES.clear()
+    _tool_index.cache_clear()
+    try:
+        os.remove(_INDEX_PATH)
+    except OSError:
+        pass
 
-    return tool_instances
+    # Re-importing a module is what re-runs its @register_tool decorators
+    for module_name in {cls.__module__ for cls in REGISTRY.values()}:
+        sys.modules.pop(module_name, None)
+    REGISTRY.clear()
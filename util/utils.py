@@ -1,8 +1,75 @@
 """Utility functions for the application."""
 
 import os
-import datetime
-from configs_file.config import Config
+import stat
+import sys
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # Annotation only; importing Utils doesn't load the config module
+    from configs_file.config import Config
+
+# Cursor home + erase display; what `clear` prints, without spawning it
+_ANSI_CLEAR = "\x1b[H\x1b[2J"
+
+# Header rule, built once
+_BAR = "=" * 50
+
+# Size units, 1024 (10 bits) apart
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# VCS metadata and virtualenv folders that project walks never descend into
+_PRUNE_DIRS = frozenset({".git", ".hg", ".svn", ".venv", "venv"})
+
+# Format shared by every timestamp the tools print or write
+_TS_FMT = "%Y-%m-%d %H:%M:%S"
+
+
+def _header(title: str) -> str:
+    """Build the header block shared by print_header and show_screen.
+
+    Args:
+        title (str): Header title.
+
+    Returns:
+        str: Title centred between two rules.
+    """
+    return f"\n{_BAR}\n{title:^50}\n{_BAR}\n"
+
+
+@lru_cache(maxsize=4096)
+def _format_size(size_bytes: int, decimals: int) -> str:
+    """Format a size, memoized since listings repeat the same byte counts.
+
+    Args:
+        size_bytes (int): Size in bytes.
+        decimals (int): Digits after the decimal point.
+
+    Returns:
+        str: Formatted size string.
+    """
+    # Each unit is 10 more bits, so the bit length picks it without a loop
+    idx = min(max(0, (size_bytes.bit_length() - 1) // 10), len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (idx * 10)):.{decimals}f} {_SIZE_UNITS[idx]}"
+
+
+def _is_dir(path: str) -> bool:
+    """Check for a directory with one stat call.
+
+    Missing paths and paths that aren't directories share the False branch.
+
+    Args:
+        path (str): Path to check.
+
+    Returns:
+        bool: True if path is an existing directory.
+    """
+    try:
+        return stat.S_ISDIR(os.stat(path).st_mode)
+    except (OSError, ValueError):
+        return False
+
 
 class Utils:
     """Utility functions for the application."""
@@ -10,7 +77,11 @@ class Utils:
     @staticmethod
     def clear_screen() -> None:
         """Clear terminal screen."""
-        os.system("cls" if os.name == "nt" else "clear")
+        # Escape codes only where a terminal will interpret them
+        if os.name != "nt" and sys.stdout.isatty():
+            sys.stdout.write(_ANSI_CLEAR)
+        else:
+            os.system("cls" if os.name == "nt" else "clear")
 
     @staticmethod
     def print_header(title: str) -> None:
@@ -19,17 +90,73 @@ class Utils:
         Args:
             title (str): Header title.
         """
-        print("\n" + "=" * 50)
-        print(f"{title:^50}")
-        print("=" * 50)
+        sys.stdout.write(_header(title))
+
+    @staticmethod
+    def show_screen(title: str, body: str = "") -> None:
+        """Clear the terminal and print a header followed by a body.
+
+        On terminals that understand escape codes the whole screen is
+        rendered in a single write.
+
+        Args:
+            title (str): Header title.
+            body (str): Text printed below the header, e.g. a menu.
+        """
+        if os.name != "nt" and sys.stdout.isatty():
+            sys.stdout.write(_ANSI_CLEAR + _header(title) + body)
+        else:
+            os.system("cls" if os.name == "nt" else "clear")
+            sys.stdout.write(_header(title) + body)
+
+    @staticmethod
+    def format_size(size_bytes: int, decimals: int = 2) -> str:
+        """Format size in human readable format.
+
+        Args:
+            size_bytes (int): Size in bytes.
+            decimals (int): Digits after the decimal point.
+
+        Returns:
+            str: Formatted size string, e.g. "1.50 MB".
+        """
+        return _format_size(size_bytes, decimals)
+
+    @staticmethod
+    def prune_walk_dirs(dirs: list, files: list) -> int:
+        """Drop VCS and virtualenv folders from an os.walk step, in place.
+
+        A folder holding pyvenv.cfg is a virtualenv whatever its name; the
+        walk's own file list says so without an extra stat.
+
+        Args:
+            dirs (list): Subfolder names of the current folder, pruned in place.
+            files (list): File names of the current folder.
+
+        Returns:
+            int: Number of subfolders pruned.
+        """
+        before = len(dirs)
+        if "pyvenv.cfg" in files:
+            dirs.clear()
+        else:
+            dirs[:] = [d for d in dirs if d not in _PRUNE_DIRS]
+        return before - len(dirs)
 
     @staticmethod
     def get_project_path() -> str:
-        """Get project path from user or use current directory.
+        """Get project path from the environment, the user or the current directory.
+
+        A valid directory in DPM_PROJECT_PATH (also set by `main.py <path>`)
+        is used without prompting, so scripted runs skip the terminal round-trip.
 
         Returns:
             str: Valid project path.
         """
+        env_path = os.environ.get("DPM_PROJECT_PATH")
+        if env_path and _is_dir(env_path):
+            return env_path
+
         default_path = os.getcwd()
         print(f"\nCurrent directory: {default_path}")
 
@@ -39,34 +166,37 @@ class Utils:
 
         while True:
             custom_path = input("Enter project path: ").strip()
-            if os.path.isdir(custom_path):
+            if _is_dir(custom_path):
                 return custom_path
             print(f"❌ Error: Path '{custom_path}' does not exist or is not a directory.")
 
     @staticmethod
-    def show_ignore_lists(config: Config) -> None:
+    def show_ignore_lists(config: "Config") -> None:
         """Display current ignore lists.
 
         Args:
             config (Config): Configuration instance.
         """
-        print("\n📁 Current Ignore Directories:")
-        print("-" * 30)
-        if config.ignore_dirs:
-            for dir_name in sorted(config.ignore_dirs):
-                print(f"  • {dir_name}")
+        # Sorted tuples are cached on Config until an ignore list changes
+        lines = ["", "📁 Current Ignore Directories:", "-" * 30]
+        ignore_dirs = config.get_ignore_dirs()
+        if ignore_dirs:
+            lines.extend(f"  • {dir_name}" for dir_name in ignore_dirs)
         else:
-            print("  (Empty)")
+            lines.append("  (Empty)")
 
-        print("\n📄 Current Ignore Files:")
-        print("-" * 30)
-        if config.ignore_files:
-            for file_name in sorted(config.ignore_files):
-                print(f"  • {file_name}")
+        lines += ["", "📄 Current Ignore Files:", "-" * 30]
+        ignore_files = config.get_ignore_files()
+        if ignore_files:
+            lines.extend(f"  • {file_name}" for file_name in ignore_files)
         else:
-            print("  (Empty)")
+            lines.append("  (Empty)")
+
+        # One write for the whole listing instead of a print per entry
+        sys.stdout.write("\n".join(lines) + "\n")
 
     @staticmethod
     def get_timestamp() -> str:
         """Get current timestamp in readable format."""
-        return datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
\ No newline at end of file
+        # time.strftime formats the struct_time directly; no datetime object
+        return time.strftime(_TS_FMT)
\ No newline at end of file